@@ -14,8 +14,7 @@ from rdflib import DCTERMS
 
 class DctermsResource(rdf.RdfResource):
     def __post_init__(self):
-        if hasattr(super(), '__post_init__'):
-            super().__post_init__()
+        super().__post_init__()
         self._namespace = DCTERMS
 
 class DctermsClass(DctermsResource):
@@ -6,8 +6,7 @@ from rdflib import FOAF
 @dataclass(kw_only=True)
 class FoafResource(RdfResource):
     def __post_init__(self):
-        if hasattr(super(), '__post_init__'):
-            super().__post_init__()
+        super().__post_init__()
         self._namespace = FOAF
 
 @dataclass(kw_only=True)
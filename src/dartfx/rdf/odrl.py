@@ -5,8 +5,7 @@ from .rdf import RdfResource
 @dataclass(kw_only=True)
 class OdrlResource(RdfResource):
     def __post_init__(self):
-        if hasattr(super(), '__post_init__'):
-            super().__post_init__()
+        super().__post_init__()
         self._namespace = ODRL2
 
 @dataclass(kw_only=True)
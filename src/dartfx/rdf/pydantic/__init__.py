@@ -1,5 +1,28 @@
-"""Public package exports for :mod:`dartfx.rdf.pydantic`."""
+"""Public package exports for :mod:`dartfx.rdf.pydantic`.
 
-from ._base import RdfBaseModel, RdfProperty
+Vocabulary modules (``dcterms``, ``spdx``, ``vcard``, ...) are loaded lazily
+on first attribute access (PEP 562), so importing the package does not pay
+for building every vocabulary's Pydantic models.
+"""
 
-__all__ = ["RdfBaseModel", "RdfProperty"]
+from importlib import import_module
+from typing import Any, List
+
+from ._base import RdfBaseModel, RdfProperty, to_rdf_stream
+
+_VOCABULARY_MODULES = frozenset(
+    {"dcterms", "foaf", "odrl", "prov", "skos", "spdx", "spdx_msgspec", "vcard", "xkos"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _VOCABULARY_MODULES:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _VOCABULARY_MODULES)
+
+
+__all__ = ["RdfBaseModel", "RdfProperty", "to_rdf_stream"]
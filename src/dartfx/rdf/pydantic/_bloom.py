@@ -0,0 +1,61 @@
+"""A small Bloom filter used for fast negative membership tests on URIs.
+
+Internal helper for :meth:`dartfx.rdf.pydantic.skos.ConceptScheme.might_contain`;
+not part of the public API.
+"""
+
+import math
+from hashlib import blake2b
+from typing import Iterable
+
+
+class BloomFilter:
+    """A fixed-size Bloom filter over strings.
+
+    Membership tests may return false positives (bounded by the error rate
+    the filter was sized for) but never false negatives.
+
+    Parameters
+    ----------
+    capacity : int
+        The expected number of items.
+    error_rate : float, optional
+        The target false positive probability. Default is 0.01.
+    """
+
+    __slots__ = ("_bits", "_size", "_hashes")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        # Very small filters overshoot the error rate, so keep at least 64 bits.
+        self._size = max(64, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], error_rate: float = 0.01) -> "BloomFilter":
+        """Build a filter sized for, and containing, ``items``."""
+        values = list(items)
+        bloom = cls(len(values), error_rate)
+        for value in values:
+            bloom.add(value)
+        return bloom
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: derive every probe from the two halves of one digest.
+        # blake2b rather than hash(), so the filter (and its false positives)
+        # does not change with PYTHONHASHSEED from one process to the next.
+        digest = int.from_bytes(blake2b(item.encode(), digest_size=16).digest(), "little")
+        first = digest & 0xFFFFFFFFFFFFFFFF
+        step = (digest >> 64) | 1
+        size = self._size
+        return ((first + i * step) % size for i in range(self._hashes))
+
+    def add(self, item: str) -> None:
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
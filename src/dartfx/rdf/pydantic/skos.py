@@ -9,12 +9,14 @@ References:
 
 """
 
-from __future__ import annotations
-from typing import Annotated, List, Optional, Union, cast
+from collections import deque
+from typing import Annotated, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+import weakref
 
-from rdflib import URIRef, SKOS, Namespace
+from rdflib import BNode, Graph, RDF, URIRef, SKOS, Namespace
 
-from ._base import RdfBaseModel, RdfProperty
+from ._base import RdfBaseModel, RdfProperty, _python_to_node
+from ._bloom import BloomFilter
 
 
 class SkosResource(RdfBaseModel):
@@ -27,6 +29,29 @@ class SkosResource(RdfBaseModel):
 SKOSXL = Namespace("http://www.w3.org/2008/05/skos-xl#")
 
 
+# Descriptors reused across classes here and in xkos; RdfProperty is immutable.
+_P_PREF_LABEL = RdfProperty(SKOS.prefLabel)
+_P_ALT_LABEL = RdfProperty(SKOS.altLabel)
+_P_HIDDEN_LABEL = RdfProperty(SKOS.hiddenLabel)
+_P_XL_PREF_LABEL = RdfProperty(SKOSXL.prefLabel)
+_P_XL_ALT_LABEL = RdfProperty(SKOSXL.altLabel)
+_P_XL_HIDDEN_LABEL = RdfProperty(SKOSXL.hiddenLabel)
+_P_NOTATION = RdfProperty(SKOS.notation)
+_P_NOTE = RdfProperty(SKOS.note)
+_P_CHANGE_NOTE = RdfProperty(SKOS.changeNote)
+_P_DEFINITION = RdfProperty(SKOS.definition)
+_P_EDITORIAL_NOTE = RdfProperty(SKOS.editorialNote)
+_P_EXAMPLE = RdfProperty(SKOS.example)
+_P_HISTORY_NOTE = RdfProperty(SKOS.historyNote)
+_P_SCOPE_NOTE = RdfProperty(SKOS.scopeNote)
+_P_HAS_TOP_CONCEPT = RdfProperty(SKOS.hasTopConcept)
+_P_IN_SCHEME = RdfProperty(SKOS.inScheme)
+_P_TOP_CONCEPT_OF = RdfProperty(SKOS.topConceptOf)
+_P_BROADER = RdfProperty(SKOS.broader)
+_P_NARROWER = RdfProperty(SKOS.narrower)
+_P_RELATED = RdfProperty(SKOS.related)
+
+
 class Label(SkosResource):
     """A SKOS-XL Label."""
     
@@ -37,127 +62,335 @@ class Label(SkosResource):
     literal_form: Annotated[str, RdfProperty(SKOSXL.literalForm)]
 
 
-class ConceptScheme(SkosResource):
-    """A SKOS Concept Scheme - an aggregation of one or more SKOS concepts."""
-    
-    rdf_type = SKOS.ConceptScheme
-    
-    id: str
+# A reference to a concept: its URI or an inline Concept model.
+ConceptRef = Union[str, URIRef, "Concept"]
+
+
+class _SkosLabeled(SkosResource):
+    """Lexical labels shared by the SKOS resource classes."""
     
     # Lexical labels
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
-    hidden_label: Annotated[Optional[List[str]], RdfProperty(SKOS.hiddenLabel)] = None
+    pref_label: Annotated[Optional[List[str]], _P_PREF_LABEL] = None
+    alt_label: Annotated[Optional[List[str]], _P_ALT_LABEL] = None
+    hidden_label: Annotated[Optional[List[str]], _P_HIDDEN_LABEL] = None
+
+
+class _SkosDocumented(_SkosLabeled):
+    """Lexical labels plus the SKOS-XL labels and documentation properties."""
     
     # SKOS-XL labels
-    pref_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], RdfProperty(SKOSXL.prefLabel)] = None
-    alt_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], RdfProperty(SKOSXL.altLabel)] = None
-    hidden_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], RdfProperty(SKOSXL.hiddenLabel)] = None
+    pref_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], _P_XL_PREF_LABEL] = None
+    alt_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], _P_XL_ALT_LABEL] = None
+    hidden_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], _P_XL_HIDDEN_LABEL] = None
     
     # Documentation properties
-    notation: Annotated[Optional[List[str]], RdfProperty(SKOS.notation)] = None
-    note: Annotated[Optional[List[str]], RdfProperty(SKOS.note)] = None
-    change_note: Annotated[Optional[List[str]], RdfProperty(SKOS.changeNote)] = None
-    definition: Annotated[Optional[List[str]], RdfProperty(SKOS.definition)] = None
-    editorial_note: Annotated[Optional[List[str]], RdfProperty(SKOS.editorialNote)] = None
-    example: Annotated[Optional[List[str]], RdfProperty(SKOS.example)] = None
-    history_note: Annotated[Optional[List[str]], RdfProperty(SKOS.historyNote)] = None
-    scope_note: Annotated[Optional[List[str]], RdfProperty(SKOS.scopeNote)] = None
+    notation: Annotated[Optional[List[str]], _P_NOTATION] = None
+    note: Annotated[Optional[List[str]], _P_NOTE] = None
+    change_note: Annotated[Optional[List[str]], _P_CHANGE_NOTE] = None
+    definition: Annotated[Optional[List[str]], _P_DEFINITION] = None
+    editorial_note: Annotated[Optional[List[str]], _P_EDITORIAL_NOTE] = None
+    example: Annotated[Optional[List[str]], _P_EXAMPLE] = None
+    history_note: Annotated[Optional[List[str]], _P_HISTORY_NOTE] = None
+    scope_note: Annotated[Optional[List[str]], _P_SCOPE_NOTE] = None
+
+
+class ConceptScheme(_SkosDocumented):
+    """A SKOS Concept Scheme - an aggregation of one or more SKOS concepts."""
+    
+    rdf_type = SKOS.ConceptScheme
+    
+    id: str
     
     # Scheme relationships
-    has_top_concept: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.hasTopConcept)] = None
+    has_top_concept: Annotated[Optional[List[ConceptRef]], _P_HAS_TOP_CONCEPT] = None
 
+    def might_contain(self, uri: Union[str, URIRef]) -> bool:
+        """Tell whether a concept URI may belong to this scheme.
+        
+        The scheme's concepts are its ``has_top_concept`` entries and,
+        for inline :class:`Concept` models, their ``narrower`` concepts
+        (recursively). The test is backed by a Bloom filter built on first
+        use: ``False`` is definite, ``True`` may be a false positive (about
+        1%), so confirm positive answers where it matters.
+        
+        Each call walks the concepts to check that none was added, removed,
+        replaced or renamed since the filter was built, including edits to
+        ``narrower`` lists; only then is the filter rebuilt.
+        """
+        members = _scheme_members(self.has_top_concept or ())
+        cached = _SCHEME_BLOOMS.get(id(self))
+        if cached is None or not _same_members(cached[0], members):
+            if cached is None:
+                weakref.finalize(self, _SCHEME_BLOOMS.pop, id(self), None)
+            cached = (members, BloomFilter.from_items(_member_uri(item) for item, _ in members))
+            _SCHEME_BLOOMS[id(self)] = cached
+        return str(uri) in cached[1]
 
-class Concept(SkosResource):
+
+class Concept(_SkosDocumented):
     """A SKOS Concept - a unit of thought."""
     
     rdf_type = SKOS.Concept
     
     id: str
     
-    # Lexical labels
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
-    hidden_label: Annotated[Optional[List[str]], RdfProperty(SKOS.hiddenLabel)] = None
-    
-    # SKOS-XL labels
-    pref_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], RdfProperty(SKOSXL.prefLabel)] = None
-    alt_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], RdfProperty(SKOSXL.altLabel)] = None
-    hidden_label_xl: Annotated[Optional[List[Union[str, URIRef, Label]]], RdfProperty(SKOSXL.hiddenLabel)] = None
-    
-    # Documentation properties
-    notation: Annotated[Optional[List[str]], RdfProperty(SKOS.notation)] = None
-    note: Annotated[Optional[List[str]], RdfProperty(SKOS.note)] = None
-    change_note: Annotated[Optional[List[str]], RdfProperty(SKOS.changeNote)] = None
-    definition: Annotated[Optional[List[str]], RdfProperty(SKOS.definition)] = None
-    editorial_note: Annotated[Optional[List[str]], RdfProperty(SKOS.editorialNote)] = None
-    example: Annotated[Optional[List[str]], RdfProperty(SKOS.example)] = None
-    history_note: Annotated[Optional[List[str]], RdfProperty(SKOS.historyNote)] = None
-    scope_note: Annotated[Optional[List[str]], RdfProperty(SKOS.scopeNote)] = None
-    
     # Scheme membership
-    in_scheme: Annotated[Optional[List[Union[str, URIRef, ConceptScheme]]], RdfProperty(SKOS.inScheme)] = None
-    top_concept_of: Annotated[Optional[List[Union[str, URIRef, ConceptScheme]]], RdfProperty(SKOS.topConceptOf)] = None
+    in_scheme: Annotated[Optional[List[Union[str, URIRef, ConceptScheme]]], _P_IN_SCHEME] = None
+    top_concept_of: Annotated[Optional[List[Union[str, URIRef, ConceptScheme]]], _P_TOP_CONCEPT_OF] = None
     
     # Semantic relations (hierarchical)
-    broader: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.broader)] = None
-    narrower: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.narrower)] = None
-    broader_transitive: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.broaderTransitive)] = None
-    narrower_transitive: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.narrowerTransitive)] = None
+    broader: Annotated[Optional[List[ConceptRef]], _P_BROADER] = None
+    narrower: Annotated[Optional[List[ConceptRef]], _P_NARROWER] = None
+    broader_transitive: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.broaderTransitive)] = None
+    narrower_transitive: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.narrowerTransitive)] = None
     
     # Semantic relations (associative)
-    related: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.related)] = None
+    related: Annotated[Optional[List[ConceptRef]], _P_RELATED] = None
     
     # Mapping properties
-    close_match: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.closeMatch)] = None
-    exact_match: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.exactMatch)] = None
-    broad_match: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.broadMatch)] = None
-    narrow_match: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.narrowMatch)] = None
-    related_match: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.relatedMatch)] = None
+    close_match: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.closeMatch)] = None
+    exact_match: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.exactMatch)] = None
+    broad_match: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.broadMatch)] = None
+    narrow_match: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.narrowMatch)] = None
+    related_match: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.relatedMatch)] = None
     
     # Super-properties
-    semantic_relation: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.semanticRelation)] = None
-    mapping_relation: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.mappingRelation)] = None
+    semantic_relation: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.semanticRelation)] = None
+    mapping_relation: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.mappingRelation)] = None
+
+    def iter_transitive(self, relation: str = "broader") -> Iterator[Union[str, URIRef, "Concept"]]:
+        """Walk a relation transitively, breadth-first.
+        
+        Yields every concept reachable through ``relation`` (e.g.
+        ``"broader"`` or ``"narrower"``), nearest first. Inline concepts are
+        followed further; URI references are yielded but cannot be followed.
+        Each concept is yielded once, so cycles and shared ancestors are
+        handled, and deep hierarchies do not hit the recursion limit.
+        
+        Parameters
+        ----------
+        relation : str, optional
+            The name of the relation field to follow. Default is ``"broader"``.
+        """
+        return _iter_transitive(self, relation)
 
 
-class Collection(SkosResource):
+class Collection(_SkosLabeled):
     """A SKOS Collection - a meaningful grouping of concepts."""
     
     rdf_type = SKOS.Collection
     
     id: str
     
-    # Lexical labels
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
-    hidden_label: Annotated[Optional[List[str]], RdfProperty(SKOS.hiddenLabel)] = None
-    
     # Documentation properties
-    notation: Annotated[Optional[List[str]], RdfProperty(SKOS.notation)] = None
-    note: Annotated[Optional[List[str]], RdfProperty(SKOS.note)] = None
+    notation: Annotated[Optional[List[str]], _P_NOTATION] = None
+    note: Annotated[Optional[List[str]], _P_NOTE] = None
     
     # Collection membership
-    member: Annotated[Optional[List[Union[str, URIRef, Concept, Collection]]], RdfProperty(SKOS.member)] = None
+    member: Annotated[Optional[List[Union[str, URIRef, Concept, "Collection"]]], RdfProperty(SKOS.member)] = None
 
 
-class OrderedCollection(SkosResource):
+class OrderedCollection(_SkosLabeled):
     """A SKOS Ordered Collection - an ordered grouping of concepts."""
     
     rdf_type = SKOS.OrderedCollection
     
     id: str
     
-    # Lexical labels
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
-    hidden_label: Annotated[Optional[List[str]], RdfProperty(SKOS.hiddenLabel)] = None
-    
     # Documentation properties
-    notation: Annotated[Optional[List[str]], RdfProperty(SKOS.notation)] = None
-    note: Annotated[Optional[List[str]], RdfProperty(SKOS.note)] = None
+    notation: Annotated[Optional[List[str]], _P_NOTATION] = None
+    note: Annotated[Optional[List[str]], _P_NOTE] = None
     
     # Ordered collection membership
-    member_list: Annotated[Optional[List[Union[str, URIRef, Concept]]], RdfProperty(SKOS.memberList)] = None
+    member_list: Annotated[Optional[List[ConceptRef]], RdfProperty(SKOS.memberList)] = None
+
+
+def _iter_transitive(start: RdfBaseModel, relation: str) -> Iterator[Any]:
+    """Breadth-first walk of ``relation`` from ``start``, with a visited set."""
+    visited = {id(start)}
+    seen_refs = set()
+    queue = deque(getattr(start, relation) or ())
+    while queue:
+        item = queue.popleft()
+        if isinstance(item, RdfBaseModel):
+            if id(item) in visited:
+                continue
+            visited.add(id(item))
+            yield item
+            queue.extend(getattr(item, relation, None) or ())
+        elif item is not None and item not in seen_refs:
+            seen_refs.add(item)
+            yield item
+
+
+# Bloom filters of ConceptScheme.might_contain, keyed by id() of the scheme and
+# kept outside the model so they do not take part in equality or dumps. Each
+# filter is stored with the members it was built from (see _scheme_members).
+_SCHEME_BLOOMS: Dict[int, Tuple[List[Tuple[Any, Any]], BloomFilter]] = {}
+
+
+def _scheme_members(top_concepts: Iterable[Any]) -> List[Tuple[Any, Any]]:
+    """List the top concepts and their inline narrower concepts, breadth-first.
+    
+    Each entry is ``(item, identifier)``: inline :class:`Concept` models come
+    with their ``id`` field, which their URI depends on; references with None.
+    """
+    queue = deque(top_concepts)
+    seen = set()
+    members = []
+    while queue:
+        item = queue.popleft()
+        if isinstance(item, Concept):
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            members.append((item, item.__dict__.get("id")))
+            queue.extend(item.narrower or ())
+        elif item is not None:
+            members.append((item, None))
+    return members
+
+
+def _same_members(old: List[Tuple[Any, Any]], new: List[Tuple[Any, Any]]) -> bool:
+    """Tell whether two _scheme_members lists yield the same concept URIs."""
+    if len(old) != len(new):
+        return False
+    for (old_item, old_id), (new_item, new_id) in zip(old, new):
+        if old_item is new_item:
+            if old_id != new_id:
+                return False
+        # Models are compared by identity; references by value.
+        elif isinstance(old_item, RdfBaseModel) or isinstance(new_item, RdfBaseModel) or old_item != new_item:
+            return False
+    return True
+
+
+def _member_uri(item: Any) -> str:
+    """Return the URI of a _scheme_members item."""
+    return str(item._subject_uri()) if isinstance(item, Concept) else str(item)
+
+class ConceptTable:
+    """A column-oriented (structure-of-arrays) collection of SKOS concepts.
+    
+    Each field of :class:`Concept` is stored as one list holding the values
+    of every concept, so bulk operations such as filtering on a label or
+    exporting a whole thesaurus iterate over one column at a time instead
+    of visiting every model instance.
+    
+    Attributes
+    ----------
+    columns : dict[str, list]
+        The field values, keyed by the :class:`Concept` field names.
+    subjects : list[URIRef | BNode]
+        The RDF subject of each row.
+    
+    Examples
+    --------
+    ::
+    
+        table = ConceptTable.from_concepts(concepts)
+        labels = table["pref_label"]
+        graph = table.to_rdf_graph()
+    """
+    
+    __slots__ = ("columns", "subjects")
+    
+    def __init__(self, columns: Dict[str, List[Any]], subjects: List[Union[URIRef, BNode]]) -> None:
+        self.columns = columns
+        self.subjects = subjects
+    
+    @classmethod
+    def from_concepts(cls, concepts: Iterable[Concept]) -> "ConceptTable":
+        """Build a table from concept instances (e.g. from ``from_rdf_graph_many``).
+        
+        Only the fields declared on :class:`Concept` are kept.
+        """
+        names = list(Concept.model_fields)
+        columns: Dict[str, List[Any]] = {name: [] for name in names}
+        subjects: List[Union[URIRef, BNode]] = []
+        appenders = [(name, columns[name].append) for name in names]
+        for concept in concepts:
+            values = concept.__dict__
+            for name, append in appenders:
+                append(values.get(name))
+            subjects.append(concept._subject_uri())
+        return cls(columns, subjects)
+    
+    def __len__(self) -> int:
+        return len(self.subjects)
+    
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.columns[name]
+    
+    def to_concepts(self, *, validate: bool = True) -> List[Concept]:
+        """Rebuild the :class:`Concept` instances, one per row.
+        
+        Parameters
+        ----------
+        validate : bool, optional
+            If False, use :meth:`~dartfx.rdf.pydantic.RdfBaseModel.fast_construct` and skip Pydantic validation.
+            Default is True.
+        """
+        build = Concept if validate else Concept.fast_construct
+        names = list(self.columns)
+        return [build(**dict(zip(names, row))) for row in zip(*self.columns.values())]
+    
+    def to_rdf_graph(
+        self,
+        graph: Optional[Graph] = None,
+        *,
+        base_uri: Optional[str] = None,
+        rdf_uri_generator: Optional[Callable[[Any], Union[URIRef, BNode]]] = None
+    ) -> Graph:
+        """Serialize every row into an rdflib Graph, one predicate at a time.
+        
+        The output matches calling :meth:`Concept.to_rdf_graph` on each
+        concept; ``base_uri`` and ``rdf_uri_generator`` apply to nested models.
+        """
+        graph = graph if graph is not None else Graph()
+        # Collected column by column, then handed to the store in one addN call.
+        context = getattr(graph, "default_context", graph)
+        quads: List[Tuple[Any, Any, Any, Any]] = []
+        add = quads.append
+        subjects = self.subjects
+        type_uri = Concept.__rdf_type_uri__
+        for subject in subjects:
+            add((subject, RDF.type, type_uri, context))
+        # (model, subject) pairs keyed by id(); see RdfBaseModel._iter_triples.
+        nested: Dict[int, Tuple[RdfBaseModel, Union[URIRef, BNode]]] = {}
+        model_types: Dict[type, None] = {Concept: None}
+        for name, predicate, is_list, inner_type, _model_type, prop, make_literal, _to_python in Concept._rdf_descriptors():
+            serializer = prop.serializer
+            for subject, value in zip(subjects, self.columns[name]):
+                if value is None:
+                    continue
+                for item in (value if is_list else (value,)):
+                    if item is None:
+                        continue
+                    if serializer is not None:
+                        item = serializer(item)
+                    if make_literal is not None and type(item) is str:
+                        node = make_literal(item)
+                    elif isinstance(item, RdfBaseModel):
+                        seen = nested.get(id(item))
+                        if seen is None:
+                            node = item._subject_uri(base_uri=base_uri, rdf_uri_generator=rdf_uri_generator)
+                            nested[id(item)] = (item, node)
+                            quads.extend(
+                                (s, p, o, context) for s, p, o in item._iter_triples(
+                                    node, base_uri=base_uri, rdf_uri_generator=rdf_uri_generator,
+                                    model_types=model_types, subjects=nested
+                                )
+                            )
+                        else:
+                            node = seen[1]
+                    else:
+                        node = _python_to_node(item, inner_type, prop)
+                    add((subject, predicate, node, context))
+        graph.addN(quads)
+        for model_type in model_types:
+            model_type._bind_prefixes(graph)
+        return graph
 
 
 __all__ = [
@@ -167,4 +400,6 @@ __all__ = [
     "Collection",
     "OrderedCollection",
     "Label",
+    "ConceptRef",
+    "ConceptTable",
 ]
@@ -10,9 +10,11 @@ References:
 """
 
 from __future__ import annotations
-from typing import Annotated, List, Optional
+from functools import lru_cache
+from typing import Annotated, Any, List, Optional
 from datetime import datetime
 
+from pydantic import BeforeValidator, Strict
 from rdflib import Namespace, URIRef
 
 from ._base import RdfBaseModel, RdfProperty
@@ -21,10 +23,51 @@ from ._base import RdfBaseModel, RdfProperty
 # SPDX namespace (not built-in to rdflib)
 SPDX = Namespace("http://spdx.org/rdf/terms#")
 
+# Shared field type aliases, built once and reused by every field below.
+_StrList = Optional[List[str]]
+_UriOrStrList = Optional[List[str | URIRef]]
+
+
+@lru_cache(maxsize=4096)
+def _parse_spdx_datetime(value: str) -> Any:
+    """Parse an ISO-8601 SPDX timestamp, memoised by the raw string.
+
+    Timestamps typically repeat across the files of a document, so parsing
+    each distinct string once avoids redundant work. Strings that
+    :meth:`datetime.fromisoformat` cannot handle are rejected rather than
+    left to Pydantic's lax parsing, which reads ``"2020"`` as a Unix time.
+    """
+    candidate = value[:-1] + "+00:00" if value.endswith(("Z", "z")) else value
+    try:
+        return datetime.fromisoformat(candidate)
+    except ValueError:
+        raise ValueError(f"Invalid SPDX timestamp (expected ISO 8601): {value!r}") from None
+
+
+def _coerce_spdx_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        return _parse_spdx_datetime(value)
+    return value
+
+
+# Strict, so numbers are not read as Unix times either.
+_DateTimeList = Optional[List[Annotated[datetime, BeforeValidator(_coerce_spdx_datetime), Strict()]]]
+
+
+@lru_cache(maxsize=None)
+def _ref_list(model: type) -> object:
+    """Return the shared ``Optional[List[str | URIRef | model]]`` alias."""
+    return Optional[List[str | URIRef | model]]
+
 
 class SpdxResource(RdfBaseModel):
-    """Base class for SPDX resources."""
-    
+    """Base class for SPDX resources.
+
+    Bulk loaders hydrate thousands of trusted packages and files with
+    :meth:`~dartfx.rdf.pydantic.RdfBaseModel.fast_construct`, which skips
+    Pydantic validation.
+    """
+
     rdf_namespace = SPDX
     rdf_prefixes = {"spdx": SPDX}
 
@@ -35,28 +78,28 @@ class SpdxDocument(SpdxResource):
     rdf_type: str = str(SPDX.SpdxDocument)
     
     # Document properties
-    spdx_version: Annotated[Optional[List[str]], RdfProperty(SPDX.spdxVersion)] = None
-    data_license: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.dataLicense)] = None
-    name: Annotated[Optional[List[str]], RdfProperty(SPDX.name)] = None
-    document_namespace: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.documentNamespace)] = None
+    spdx_version: Annotated[_StrList, RdfProperty(SPDX.spdxVersion)] = None
+    data_license: Annotated[_UriOrStrList, RdfProperty(SPDX.dataLicense)] = None
+    name: Annotated[_StrList, RdfProperty(SPDX.name)] = None
+    document_namespace: Annotated[_UriOrStrList, RdfProperty(SPDX.documentNamespace)] = None
     
     # Creation info
-    creation_info: Annotated[Optional[List[str | URIRef | CreationInfo]], RdfProperty(SPDX.creationInfo)] = None
+    creation_info: Annotated[_ref_list(CreationInfo), RdfProperty(SPDX.creationInfo)] = None
     
     # External references
-    external_document_ref: Annotated[Optional[List[str | URIRef | ExternalDocumentRef]], RdfProperty(SPDX.externalDocumentRef)] = None
+    external_document_ref: Annotated[_ref_list(ExternalDocumentRef), RdfProperty(SPDX.externalDocumentRef)] = None
     
     # Describes
-    describes_package: Annotated[Optional[List[str | URIRef | Package]], RdfProperty(SPDX.describesPackage)] = None
+    describes_package: Annotated[_ref_list(Package), RdfProperty(SPDX.describesPackage)] = None
     
     # Relationships
-    relationship: Annotated[Optional[List[str | URIRef | Relationship]], RdfProperty(SPDX.relationship)] = None
+    relationship: Annotated[_ref_list(Relationship), RdfProperty(SPDX.relationship)] = None
     
     # Annotations
-    annotation: Annotated[Optional[List[str | URIRef | Annotation]], RdfProperty(SPDX.annotation)] = None
+    annotation: Annotated[_ref_list(Annotation), RdfProperty(SPDX.annotation)] = None
     
     # Comment
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class CreationInfo(SpdxResource):
@@ -64,10 +107,10 @@ class CreationInfo(SpdxResource):
     
     rdf_type: str = str(SPDX.CreationInfo)
     
-    created: Annotated[Optional[List[str | datetime]], RdfProperty(SPDX.created)] = None
-    creator: Annotated[Optional[List[str]], RdfProperty(SPDX.creator)] = None
-    license_list_version: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseListVersion)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    created: Annotated[_DateTimeList, RdfProperty(SPDX.created)] = None
+    creator: Annotated[_StrList, RdfProperty(SPDX.creator)] = None
+    license_list_version: Annotated[_StrList, RdfProperty(SPDX.licenseListVersion)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class Package(SpdxResource):
@@ -76,46 +119,46 @@ class Package(SpdxResource):
     rdf_type: str = str(SPDX.Package)
     
     # Basic info
-    name: Annotated[Optional[List[str]], RdfProperty(SPDX.name)] = None
-    version_info: Annotated[Optional[List[str]], RdfProperty(SPDX.versionInfo)] = None
-    package_file_name: Annotated[Optional[List[str]], RdfProperty(SPDX.packageFileName)] = None
-    supplier: Annotated[Optional[List[str]], RdfProperty(SPDX.supplier)] = None
-    originator: Annotated[Optional[List[str]], RdfProperty(SPDX.originator)] = None
-    download_location: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.downloadLocation)] = None
+    name: Annotated[_StrList, RdfProperty(SPDX.name)] = None
+    version_info: Annotated[_StrList, RdfProperty(SPDX.versionInfo)] = None
+    package_file_name: Annotated[_StrList, RdfProperty(SPDX.packageFileName)] = None
+    supplier: Annotated[_StrList, RdfProperty(SPDX.supplier)] = None
+    originator: Annotated[_StrList, RdfProperty(SPDX.originator)] = None
+    download_location: Annotated[_UriOrStrList, RdfProperty(SPDX.downloadLocation)] = None
     
     # Verification
-    package_verification_code: Annotated[Optional[List[str | URIRef | PackageVerificationCode]], RdfProperty(SPDX.packageVerificationCode)] = None
-    checksum: Annotated[Optional[List[str | URIRef | Checksum]], RdfProperty(SPDX.checksum)] = None
+    package_verification_code: Annotated[_ref_list(PackageVerificationCode), RdfProperty(SPDX.packageVerificationCode)] = None
+    checksum: Annotated[_ref_list(Checksum), RdfProperty(SPDX.checksum)] = None
     
     # Homepage
-    homepage: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.homepage)] = None
+    homepage: Annotated[_UriOrStrList, RdfProperty(SPDX.homepage)] = None
     
     # Source info
-    source_info: Annotated[Optional[List[str]], RdfProperty(SPDX.sourceInfo)] = None
+    source_info: Annotated[_StrList, RdfProperty(SPDX.sourceInfo)] = None
     
     # License info
-    license_concluded: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.licenseConcluded)] = None
-    license_info_from_files: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.licenseInfoFromFiles)] = None
-    license_declared: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.licenseDeclared)] = None
-    license_comments: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseComments)] = None
-    copyright_text: Annotated[Optional[List[str]], RdfProperty(SPDX.copyrightText)] = None
+    license_concluded: Annotated[_UriOrStrList, RdfProperty(SPDX.licenseConcluded)] = None
+    license_info_from_files: Annotated[_UriOrStrList, RdfProperty(SPDX.licenseInfoFromFiles)] = None
+    license_declared: Annotated[_UriOrStrList, RdfProperty(SPDX.licenseDeclared)] = None
+    license_comments: Annotated[_StrList, RdfProperty(SPDX.licenseComments)] = None
+    copyright_text: Annotated[_StrList, RdfProperty(SPDX.copyrightText)] = None
     
     # Summary and description
-    summary: Annotated[Optional[List[str]], RdfProperty(SPDX.summary)] = None
-    description: Annotated[Optional[List[str]], RdfProperty(SPDX.description)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    summary: Annotated[_StrList, RdfProperty(SPDX.summary)] = None
+    description: Annotated[_StrList, RdfProperty(SPDX.description)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
     
     # External references
-    external_ref: Annotated[Optional[List[str | URIRef | ExternalRef]], RdfProperty(SPDX.externalRef)] = None
+    external_ref: Annotated[_ref_list(ExternalRef), RdfProperty(SPDX.externalRef)] = None
     
     # Files
-    has_file: Annotated[Optional[List[str | URIRef | File]], RdfProperty(SPDX.hasFile)] = None
+    has_file: Annotated[_ref_list(File), RdfProperty(SPDX.hasFile)] = None
     
     # Attribution
-    attribution_text: Annotated[Optional[List[str]], RdfProperty(SPDX.attributionText)] = None
+    attribution_text: Annotated[_StrList, RdfProperty(SPDX.attributionText)] = None
     
     # Other
-    primary_package_purpose: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.primaryPackagePurpose)] = None
+    primary_package_purpose: Annotated[_UriOrStrList, RdfProperty(SPDX.primaryPackagePurpose)] = None
 
 
 class File(SpdxResource):
@@ -124,31 +167,31 @@ class File(SpdxResource):
     rdf_type: str = str(SPDX.File)
     
     # Basic info
-    file_name: Annotated[Optional[List[str]], RdfProperty(SPDX.fileName)] = None
-    file_type: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.fileType)] = None
+    file_name: Annotated[_StrList, RdfProperty(SPDX.fileName)] = None
+    file_type: Annotated[_UriOrStrList, RdfProperty(SPDX.fileType)] = None
     
     # Checksums
-    checksum: Annotated[Optional[List[str | URIRef | Checksum]], RdfProperty(SPDX.checksum)] = None
+    checksum: Annotated[_ref_list(Checksum), RdfProperty(SPDX.checksum)] = None
     
     # License info
-    license_concluded: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.licenseConcluded)] = None
-    license_info_in_file: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.licenseInfoInFile)] = None
-    license_comments: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseComments)] = None
-    copyright_text: Annotated[Optional[List[str]], RdfProperty(SPDX.copyrightText)] = None
+    license_concluded: Annotated[_UriOrStrList, RdfProperty(SPDX.licenseConcluded)] = None
+    license_info_in_file: Annotated[_UriOrStrList, RdfProperty(SPDX.licenseInfoInFile)] = None
+    license_comments: Annotated[_StrList, RdfProperty(SPDX.licenseComments)] = None
+    copyright_text: Annotated[_StrList, RdfProperty(SPDX.copyrightText)] = None
     
     # Notices
-    notice_text: Annotated[Optional[List[str]], RdfProperty(SPDX.noticeText)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    notice_text: Annotated[_StrList, RdfProperty(SPDX.noticeText)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
     
     # Attribution
-    attribution_text: Annotated[Optional[List[str]], RdfProperty(SPDX.attributionText)] = None
+    attribution_text: Annotated[_StrList, RdfProperty(SPDX.attributionText)] = None
     
     # Contributors
-    file_contributor: Annotated[Optional[List[str]], RdfProperty(SPDX.fileContributor)] = None
+    file_contributor: Annotated[_StrList, RdfProperty(SPDX.fileContributor)] = None
     
     # Deprecated properties
-    file_dependency: Annotated[Optional[List[str | URIRef | File]], RdfProperty(SPDX.fileDependency)] = None
-    artifact_of: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.artifactOf)] = None
+    file_dependency: Annotated[_ref_list(File), RdfProperty(SPDX.fileDependency)] = None
+    artifact_of: Annotated[_UriOrStrList, RdfProperty(SPDX.artifactOf)] = None
 
 
 class Checksum(SpdxResource):
@@ -156,8 +199,8 @@ class Checksum(SpdxResource):
     
     rdf_type: str = str(SPDX.Checksum)
     
-    algorithm: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.algorithm)] = None
-    checksum_value: Annotated[Optional[List[str]], RdfProperty(SPDX.checksumValue)] = None
+    algorithm: Annotated[_UriOrStrList, RdfProperty(SPDX.algorithm)] = None
+    checksum_value: Annotated[_StrList, RdfProperty(SPDX.checksumValue)] = None
 
 
 class PackageVerificationCode(SpdxResource):
@@ -165,8 +208,8 @@ class PackageVerificationCode(SpdxResource):
     
     rdf_type: str = str(SPDX.PackageVerificationCode)
     
-    package_verification_code_value: Annotated[Optional[List[str]], RdfProperty(SPDX.packageVerificationCodeValue)] = None
-    package_verification_code_excluded_file: Annotated[Optional[List[str]], RdfProperty(SPDX.packageVerificationCodeExcludedFile)] = None
+    package_verification_code_value: Annotated[_StrList, RdfProperty(SPDX.packageVerificationCodeValue)] = None
+    package_verification_code_excluded_file: Annotated[_StrList, RdfProperty(SPDX.packageVerificationCodeExcludedFile)] = None
 
 
 class Relationship(SpdxResource):
@@ -174,9 +217,9 @@ class Relationship(SpdxResource):
     
     rdf_type: str = str(SPDX.Relationship)
     
-    relationship_type: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.relationshipType)] = None
-    related_spdx_element: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.relatedSpdxElement)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    relationship_type: Annotated[_UriOrStrList, RdfProperty(SPDX.relationshipType)] = None
+    related_spdx_element: Annotated[_UriOrStrList, RdfProperty(SPDX.relatedSpdxElement)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class Annotation(SpdxResource):
@@ -184,10 +227,10 @@ class Annotation(SpdxResource):
     
     rdf_type: str = str(SPDX.Annotation)
     
-    annotator: Annotated[Optional[List[str]], RdfProperty(SPDX.annotator)] = None
-    annotation_date: Annotated[Optional[List[str | datetime]], RdfProperty(SPDX.annotationDate)] = None
-    annotation_type: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.annotationType)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    annotator: Annotated[_StrList, RdfProperty(SPDX.annotator)] = None
+    annotation_date: Annotated[_DateTimeList, RdfProperty(SPDX.annotationDate)] = None
+    annotation_type: Annotated[_UriOrStrList, RdfProperty(SPDX.annotationType)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class ExternalRef(SpdxResource):
@@ -195,10 +238,10 @@ class ExternalRef(SpdxResource):
     
     rdf_type: str = str(SPDX.ExternalRef)
     
-    reference_category: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.referenceCategory)] = None
-    reference_type: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.referenceType)] = None
-    reference_locator: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.referenceLocator)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    reference_category: Annotated[_UriOrStrList, RdfProperty(SPDX.referenceCategory)] = None
+    reference_type: Annotated[_UriOrStrList, RdfProperty(SPDX.referenceType)] = None
+    reference_locator: Annotated[_UriOrStrList, RdfProperty(SPDX.referenceLocator)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class ExternalDocumentRef(SpdxResource):
@@ -206,19 +249,19 @@ class ExternalDocumentRef(SpdxResource):
     
     rdf_type: str = str(SPDX.ExternalDocumentRef)
     
-    external_document_id: Annotated[Optional[List[str]], RdfProperty(SPDX.externalDocumentId)] = None
-    spdx_document: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.spdxDocument)] = None
-    checksum: Annotated[Optional[List[str | URIRef | Checksum]], RdfProperty(SPDX.checksum)] = None
+    external_document_id: Annotated[_StrList, RdfProperty(SPDX.externalDocumentId)] = None
+    spdx_document: Annotated[_UriOrStrList, RdfProperty(SPDX.spdxDocument)] = None
+    checksum: Annotated[_ref_list(Checksum), RdfProperty(SPDX.checksum)] = None
 
 
 class License(SpdxResource):
     """Base class for SPDX Licenses."""
     
-    license_id: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseId)] = None
-    name: Annotated[Optional[List[str]], RdfProperty(SPDX.name)] = None
-    license_text: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseText)] = None
-    see_also: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.seeAlso)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    license_id: Annotated[_StrList, RdfProperty(SPDX.licenseId)] = None
+    name: Annotated[_StrList, RdfProperty(SPDX.name)] = None
+    license_text: Annotated[_StrList, RdfProperty(SPDX.licenseText)] = None
+    see_also: Annotated[_UriOrStrList, RdfProperty(SPDX.seeAlso)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class ExtractedLicensingInfo(License):
@@ -232,14 +275,14 @@ class Snippet(SpdxResource):
     
     rdf_type: str = str(SPDX.Snippet)
     
-    snippet_from_file: Annotated[Optional[List[str | URIRef | File]], RdfProperty(SPDX.snippetFromFile)] = None
-    snippet_byte_range: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.snippetByteRange)] = None
-    snippet_line_range: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.snippetLineRange)] = None
-    license_info_in_snippet: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.licenseInfoInSnippet)] = None
-    license_concluded: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.licenseConcluded)] = None
-    copyright_text: Annotated[Optional[List[str]], RdfProperty(SPDX.copyrightText)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
-    name: Annotated[Optional[List[str]], RdfProperty(SPDX.name)] = None
+    snippet_from_file: Annotated[_ref_list(File), RdfProperty(SPDX.snippetFromFile)] = None
+    snippet_byte_range: Annotated[_UriOrStrList, RdfProperty(SPDX.snippetByteRange)] = None
+    snippet_line_range: Annotated[_UriOrStrList, RdfProperty(SPDX.snippetLineRange)] = None
+    license_info_in_snippet: Annotated[_UriOrStrList, RdfProperty(SPDX.licenseInfoInSnippet)] = None
+    license_concluded: Annotated[_UriOrStrList, RdfProperty(SPDX.licenseConcluded)] = None
+    copyright_text: Annotated[_StrList, RdfProperty(SPDX.copyrightText)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
+    name: Annotated[_StrList, RdfProperty(SPDX.name)] = None
 
 
 class Review(SpdxResource):
@@ -247,9 +290,9 @@ class Review(SpdxResource):
     
     rdf_type: str = str(SPDX.Review)
     
-    reviewer: Annotated[Optional[List[str]], RdfProperty(SPDX.reviewer)] = None
-    review_date: Annotated[Optional[List[str | datetime]], RdfProperty(SPDX.reviewDate)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    reviewer: Annotated[_StrList, RdfProperty(SPDX.reviewer)] = None
+    review_date: Annotated[_DateTimeList, RdfProperty(SPDX.reviewDate)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class LicenseException(SpdxResource):
@@ -257,12 +300,12 @@ class LicenseException(SpdxResource):
     
     rdf_type: str = str(SPDX.LicenseException)
     
-    license_exception_id: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseExceptionId)] = None
-    name: Annotated[Optional[List[str]], RdfProperty(SPDX.name)] = None
-    license_exception_text: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseExceptionText)] = None
-    license_exception_template: Annotated[Optional[List[str]], RdfProperty(SPDX.licenseExceptionTemplate)] = None
-    see_also: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.seeAlso)] = None
-    comment: Annotated[Optional[List[str]], RdfProperty(SPDX.comment)] = None
+    license_exception_id: Annotated[_StrList, RdfProperty(SPDX.licenseExceptionId)] = None
+    name: Annotated[_StrList, RdfProperty(SPDX.name)] = None
+    license_exception_text: Annotated[_StrList, RdfProperty(SPDX.licenseExceptionText)] = None
+    license_exception_template: Annotated[_StrList, RdfProperty(SPDX.licenseExceptionTemplate)] = None
+    see_also: Annotated[_UriOrStrList, RdfProperty(SPDX.seeAlso)] = None
+    comment: Annotated[_StrList, RdfProperty(SPDX.comment)] = None
 
 
 class SimpleLicensingInfo(License):
@@ -276,7 +319,7 @@ class OrLaterOperator(License):
     
     rdf_type: str = str(SPDX.OrLaterOperator)
     
-    member: Annotated[Optional[List[str | URIRef | License]], RdfProperty(SPDX.member)] = None
+    member: Annotated[_ref_list(License), RdfProperty(SPDX.member)] = None
 
 
 class WithExceptionOperator(License):
@@ -284,8 +327,8 @@ class WithExceptionOperator(License):
     
     rdf_type: str = str(SPDX.WithExceptionOperator)
     
-    member: Annotated[Optional[List[str | URIRef | License]], RdfProperty(SPDX.member)] = None
-    license_exception: Annotated[Optional[List[str | URIRef | LicenseException]], RdfProperty(SPDX.licenseException)] = None
+    member: Annotated[_ref_list(License), RdfProperty(SPDX.member)] = None
+    license_exception: Annotated[_ref_list(LicenseException), RdfProperty(SPDX.licenseException)] = None
 
 
 class ConjunctiveLicenseSet(License):
@@ -293,7 +336,7 @@ class ConjunctiveLicenseSet(License):
     
     rdf_type: str = str(SPDX.ConjunctiveLicenseSet)
     
-    member: Annotated[Optional[List[str | URIRef | License]], RdfProperty(SPDX.member)] = None
+    member: Annotated[_ref_list(License), RdfProperty(SPDX.member)] = None
 
 
 class DisjunctiveLicenseSet(License):
@@ -301,7 +344,7 @@ class DisjunctiveLicenseSet(License):
     
     rdf_type: str = str(SPDX.DisjunctiveLicenseSet)
     
-    member: Annotated[Optional[List[str | URIRef | License]], RdfProperty(SPDX.member)] = None
+    member: Annotated[_ref_list(License), RdfProperty(SPDX.member)] = None
 
 
 class ReferenceType(SpdxResource):
@@ -309,9 +352,9 @@ class ReferenceType(SpdxResource):
     
     rdf_type: str = str(SPDX.ReferenceType)
     
-    contextual_example: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.contextualExample)] = None
-    external_reference_site: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.externalReferenceSite)] = None
-    documentation: Annotated[Optional[List[str | URIRef]], RdfProperty(SPDX.documentation)] = None
+    contextual_example: Annotated[_UriOrStrList, RdfProperty(SPDX.contextualExample)] = None
+    external_reference_site: Annotated[_UriOrStrList, RdfProperty(SPDX.externalReferenceSite)] = None
+    documentation: Annotated[_UriOrStrList, RdfProperty(SPDX.documentation)] = None
 
 
 class FileType(SpdxResource):
@@ -320,6 +363,12 @@ class FileType(SpdxResource):
     rdf_type: str = str(SPDX.FileType)
 
 
+# Resolve forward references once at import time, dependencies first.
+File.model_rebuild()
+Package.model_rebuild()
+SpdxDocument.model_rebuild()
+
+
 __all__ = [
     "SpdxResource",
     "SpdxDocument",
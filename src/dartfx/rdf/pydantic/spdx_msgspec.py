@@ -0,0 +1,312 @@
+"""msgspec mirrors of the SPDX Pydantic models for fast JSON I/O.
+
+Validating large SPDX documents (thousands of packages and files) through
+Pydantic is comparatively expensive when the data comes from a trusted
+store. This module provides :class:`msgspec.Struct` mirror classes for the
+document tree rooted at :class:`~dartfx.rdf.pydantic.spdx.SpdxDocument`,
+together with converters to and from the Pydantic models.
+
+The mirrors use the same field names as the Pydantic models, so JSON
+produced by ``SpdxDocument.model_dump_json()`` can be decoded directly.
+Decoding is done by msgspec; the resulting structs are converted to
+Pydantic models with ``RdfBaseModel.fast_construct`` (no re-validation),
+so only data from trusted sources should be loaded this way.
+
+This module requires the optional ``msgspec`` dependency::
+
+    pip install dartfx-rdf[msgspec]
+
+Examples
+--------
+>>> from dartfx.rdf.pydantic.spdx_msgspec import load_spdx_json  # doctest: +SKIP
+>>> document = load_spdx_json("sbom.json")  # doctest: +SKIP
+>>> document.to_rdf("turtle")  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, Union
+
+try:
+    import msgspec
+except ImportError as exc:  # pragma: no cover - exercised without msgspec
+    raise ImportError(
+        "dartfx.rdf.pydantic.spdx_msgspec requires the optional 'msgspec' "
+        "package; install it with 'pip install dartfx-rdf[msgspec]'."
+    ) from exc
+
+from ._base import RdfBaseModel
+from .spdx import (
+    Annotation,
+    Checksum,
+    CreationInfo,
+    ExternalDocumentRef,
+    ExternalRef,
+    File,
+    Package,
+    PackageVerificationCode,
+    Relationship,
+    SpdxDocument,
+    SpdxResource,
+)
+
+
+class _SpdxStruct(msgspec.Struct, frozen=True, kw_only=True, omit_defaults=True):
+    """Common configuration for all SPDX mirror structs."""
+
+
+class ChecksumMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.Checksum`."""
+
+    algorithm: Optional[List[str]] = None
+    checksum_value: Optional[List[str]] = None
+
+
+class PackageVerificationCodeMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.PackageVerificationCode`."""
+
+    package_verification_code_value: Optional[List[str]] = None
+    package_verification_code_excluded_file: Optional[List[str]] = None
+
+
+class ExternalRefMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.ExternalRef`."""
+
+    reference_category: Optional[List[str]] = None
+    reference_type: Optional[List[str]] = None
+    reference_locator: Optional[List[str]] = None
+    comment: Optional[List[str]] = None
+
+
+class FileMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.File`."""
+
+    file_name: Optional[List[str]] = None
+    file_type: Optional[List[str]] = None
+    checksum: Optional[List[Union[str, ChecksumMsg]]] = None
+    license_concluded: Optional[List[str]] = None
+    license_info_in_file: Optional[List[str]] = None
+    license_comments: Optional[List[str]] = None
+    copyright_text: Optional[List[str]] = None
+    notice_text: Optional[List[str]] = None
+    comment: Optional[List[str]] = None
+    attribution_text: Optional[List[str]] = None
+    file_contributor: Optional[List[str]] = None
+    file_dependency: Optional[List[Union[str, FileMsg]]] = None
+    artifact_of: Optional[List[str]] = None
+
+
+class PackageMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.Package`."""
+
+    name: Optional[List[str]] = None
+    version_info: Optional[List[str]] = None
+    package_file_name: Optional[List[str]] = None
+    supplier: Optional[List[str]] = None
+    originator: Optional[List[str]] = None
+    download_location: Optional[List[str]] = None
+    package_verification_code: Optional[List[Union[str, PackageVerificationCodeMsg]]] = None
+    checksum: Optional[List[Union[str, ChecksumMsg]]] = None
+    homepage: Optional[List[str]] = None
+    source_info: Optional[List[str]] = None
+    license_concluded: Optional[List[str]] = None
+    license_info_from_files: Optional[List[str]] = None
+    license_declared: Optional[List[str]] = None
+    license_comments: Optional[List[str]] = None
+    copyright_text: Optional[List[str]] = None
+    summary: Optional[List[str]] = None
+    description: Optional[List[str]] = None
+    comment: Optional[List[str]] = None
+    external_ref: Optional[List[Union[str, ExternalRefMsg]]] = None
+    has_file: Optional[List[Union[str, FileMsg]]] = None
+    attribution_text: Optional[List[str]] = None
+    primary_package_purpose: Optional[List[str]] = None
+
+
+class CreationInfoMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.CreationInfo`."""
+
+    created: Optional[List[datetime]] = None
+    creator: Optional[List[str]] = None
+    license_list_version: Optional[List[str]] = None
+    comment: Optional[List[str]] = None
+
+
+class ExternalDocumentRefMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.ExternalDocumentRef`."""
+
+    external_document_id: Optional[List[str]] = None
+    spdx_document: Optional[List[str]] = None
+    checksum: Optional[List[Union[str, ChecksumMsg]]] = None
+
+
+class RelationshipMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.Relationship`."""
+
+    relationship_type: Optional[List[str]] = None
+    related_spdx_element: Optional[List[str]] = None
+    comment: Optional[List[str]] = None
+
+
+class AnnotationMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.Annotation`."""
+
+    annotator: Optional[List[str]] = None
+    annotation_date: Optional[List[datetime]] = None
+    annotation_type: Optional[List[str]] = None
+    comment: Optional[List[str]] = None
+
+
+class SpdxDocumentMsg(_SpdxStruct):
+    """Mirror of :class:`~dartfx.rdf.pydantic.spdx.SpdxDocument`."""
+
+    spdx_version: Optional[List[str]] = None
+    data_license: Optional[List[str]] = None
+    name: Optional[List[str]] = None
+    document_namespace: Optional[List[str]] = None
+    creation_info: Optional[List[Union[str, CreationInfoMsg]]] = None
+    external_document_ref: Optional[List[Union[str, ExternalDocumentRefMsg]]] = None
+    describes_package: Optional[List[Union[str, PackageMsg]]] = None
+    relationship: Optional[List[Union[str, RelationshipMsg]]] = None
+    annotation: Optional[List[Union[str, AnnotationMsg]]] = None
+    comment: Optional[List[str]] = None
+
+
+# Mirror struct -> Pydantic model (and the reverse mapping below).
+_MODEL_FOR_STRUCT: Dict[Type[_SpdxStruct], Type[SpdxResource]] = {
+    ChecksumMsg: Checksum,
+    PackageVerificationCodeMsg: PackageVerificationCode,
+    ExternalRefMsg: ExternalRef,
+    FileMsg: File,
+    PackageMsg: Package,
+    CreationInfoMsg: CreationInfo,
+    ExternalDocumentRefMsg: ExternalDocumentRef,
+    RelationshipMsg: Relationship,
+    AnnotationMsg: Annotation,
+    SpdxDocumentMsg: SpdxDocument,
+}
+_STRUCT_FOR_MODEL: Dict[Type[SpdxResource], Type[_SpdxStruct]] = {
+    model: struct for struct, model in _MODEL_FOR_STRUCT.items()
+}
+
+_DECODER = msgspec.json.Decoder(SpdxDocumentMsg)
+_ENCODER = msgspec.json.Encoder()
+
+
+def to_pydantic(struct: _SpdxStruct) -> SpdxResource:
+    """Convert a mirror struct (and its nested structs) to Pydantic models.
+
+    The models are built with
+    :meth:`~dartfx.rdf.pydantic.RdfBaseModel.fast_construct` and are
+    therefore not validated.
+
+    Parameters
+    ----------
+    struct:
+        An instance of one of the ``*Msg`` mirror classes.
+
+    Returns
+    -------
+    SpdxResource
+        The corresponding SPDX Pydantic model instance.
+    """
+
+    model_cls = _MODEL_FOR_STRUCT.get(type(struct))
+    if model_cls is None:
+        raise TypeError(f"No SPDX model registered for {type(struct).__name__}")
+    values: Dict[str, Any] = {}
+    for name in struct.__struct_fields__:
+        value = getattr(struct, name)
+        if value is None:
+            continue
+        values[name] = [
+            to_pydantic(item) if isinstance(item, _SpdxStruct) else item
+            for item in value
+        ]
+    return model_cls.fast_construct(**values)
+
+
+def from_pydantic(model: RdfBaseModel) -> _SpdxStruct:
+    """Convert an SPDX Pydantic model (and its nested models) to mirror structs.
+
+    Parameters
+    ----------
+    model:
+        An instance of one of the SPDX models mirrored by this module.
+
+    Returns
+    -------
+    msgspec.Struct
+        The corresponding ``*Msg`` mirror instance.
+    """
+
+    struct_cls = _STRUCT_FOR_MODEL.get(type(model))
+    if struct_cls is None:
+        raise TypeError(f"No msgspec mirror registered for {type(model).__name__}")
+    values: Dict[str, Any] = {}
+    for name in struct_cls.__struct_fields__:
+        value = getattr(model, name, None)
+        if value is None:
+            continue
+        values[name] = [_plain_value(item) for item in value]
+    return struct_cls(**values)
+
+
+def load_spdx_json(path: Union[str, Path]) -> SpdxDocument:
+    """Load an SPDX document from a JSON file without Pydantic validation.
+
+    Parameters
+    ----------
+    path:
+        Location of a JSON document using the field names of
+        :class:`~dartfx.rdf.pydantic.spdx.SpdxDocument`.
+
+    Returns
+    -------
+    SpdxDocument
+        The decoded document.
+    """
+
+    return to_pydantic(_DECODER.decode(Path(path).read_bytes()))
+
+
+def dump_spdx_json(document: SpdxDocument, path: Union[str, Path]) -> None:
+    """Write an SPDX document to a JSON file readable by :func:`load_spdx_json`.
+
+    Parameters
+    ----------
+    document:
+        The SPDX document to persist.
+    path:
+        Destination file.
+    """
+
+    Path(path).write_bytes(_ENCODER.encode(from_pydantic(document)))
+
+
+def _plain_value(item: Any) -> Any:
+    if isinstance(item, RdfBaseModel):
+        return from_pydantic(item)
+    if isinstance(item, datetime):
+        return item
+    return str(item)
+
+
+__all__ = [
+    "SpdxDocumentMsg",
+    "CreationInfoMsg",
+    "PackageMsg",
+    "FileMsg",
+    "ChecksumMsg",
+    "PackageVerificationCodeMsg",
+    "ExternalRefMsg",
+    "ExternalDocumentRefMsg",
+    "RelationshipMsg",
+    "AnnotationMsg",
+    "to_pydantic",
+    "from_pydantic",
+    "load_spdx_json",
+    "dump_spdx_json",
+]
@@ -9,18 +9,53 @@ References:
 
 """
 
-from __future__ import annotations
-from typing import Annotated, List, Optional
+from enum import IntEnum
+import sys
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
 
-from rdflib import Namespace, URIRef
+from pydantic import Discriminator, Tag
+from rdflib import Graph, Namespace, RDF, URIRef
 
-from ._base import RdfBaseModel, RdfProperty
+from ._base import RdfBaseModel, RdfProperty, _sole_subject
 
 
 # VCARD namespace (not built-in to rdflib)
 VCARD = Namespace("http://www.w3.org/2006/vcard/ns#")
 
 
+# Hyphenated terms, which need Namespace.__getitem__ rather than attribute access.
+_ORGANIZATION_NAME = VCARD["organization-name"]
+_ORGANIZATION_UNIT = VCARD["organization-unit"]
+_FAMILY_NAME = VCARD["family-name"]
+_GIVEN_NAME = VCARD["given-name"]
+_ADDITIONAL_NAME = VCARD["additional-name"]
+_HONORIFIC_PREFIX = VCARD["honorific-prefix"]
+_HONORIFIC_SUFFIX = VCARD["honorific-suffix"]
+_STREET_ADDRESS = VCARD["street-address"]
+_POSTAL_CODE = VCARD["postal-code"]
+_COUNTRY_NAME = VCARD["country-name"]
+_POST_OFFICE_BOX = VCARD["post-office-box"]
+_EXTENDED_ADDRESS = VCARD["extended-address"]
+
+# rdf:type values, interned so that every instance shares one string.
+_T_VCARD = sys.intern(str(VCARD.VCard))
+_T_INDIVIDUAL = sys.intern(str(VCARD.Individual))
+_T_GROUP = sys.intern(str(VCARD.Group))
+_T_ORGANIZATION = sys.intern(str(VCARD.Organization))
+_T_LOCATION = sys.intern(str(VCARD.Location))
+_T_NAME = sys.intern(str(VCARD.Name))
+_T_ADDRESS = sys.intern(str(VCARD.Address))
+_T_TELEPHONE = sys.intern(str(VCARD.Telephone))
+_T_EMAIL = sys.intern(str(VCARD.Email))
+_T_GENDER = sys.intern(str(VCARD.Gender))
+_T_RELATED = sys.intern(str(VCARD.Related))
+_T_KIND = sys.intern(str(VCARD.Kind))
+_T_TYPE = sys.intern(str(VCARD.Type))
+
+# Descriptors shared by several classes; RdfProperty is immutable.
+_P_HAS_VALUE = RdfProperty(VCARD.hasValue)
+
+
 class VcardResource(RdfBaseModel):
     """Base class for vCard resources."""
     
@@ -31,24 +66,24 @@ class VcardResource(RdfBaseModel):
 class VCard(VcardResource):
     """A vCard - electronic business card."""
     
-    rdf_type: str = str(VCARD.VCard)
+    rdf_type: str = _T_VCARD
     
     # Identification
     fn: Annotated[Optional[List[str]], RdfProperty(VCARD.fn)] = None  # Formatted name
-    n: Annotated[Optional[List[str | URIRef | Name]], RdfProperty(VCARD.n)] = None  # Name
+    n: Annotated[Optional[List["str | URIRef | Name"]], RdfProperty(VCARD.n)] = None  # Name
     nickname: Annotated[Optional[List[str]], RdfProperty(VCARD.nickname)] = None
     
     # Delivery address
-    adr: Annotated[Optional[List[str | URIRef | Address]], RdfProperty(VCARD.adr)] = None
+    adr: Annotated[Optional[List["str | URIRef | Address"]], RdfProperty(VCARD.adr)] = None
     
     # Telecommunications
-    tel: Annotated[Optional[List[str | URIRef | Telephone]], RdfProperty(VCARD.tel)] = None
-    email: Annotated[Optional[List[str | URIRef | Email]], RdfProperty(VCARD.email)] = None
+    tel: Annotated[Optional[List["str | URIRef | Telephone"]], RdfProperty(VCARD.tel)] = None
+    email: Annotated[Optional[List["str | URIRef | Email"]], RdfProperty(VCARD.email)] = None
     
     # Organization
-    org: Annotated[Optional[List[str | URIRef | Organization]], RdfProperty(VCARD.org)] = None
-    organization_name: Annotated[Optional[List[str]], RdfProperty(VCARD["organization-name"])] = None
-    organization_unit: Annotated[Optional[List[str]], RdfProperty(VCARD["organization-unit"])] = None
+    org: Annotated[Optional[List["str | URIRef | Organization"]], RdfProperty(VCARD.org)] = None
+    organization_name: Annotated[Optional[List[str]], RdfProperty(_ORGANIZATION_NAME)] = None
+    organization_unit: Annotated[Optional[List[str]], RdfProperty(_ORGANIZATION_UNIT)] = None
     
     # Title and role
     title: Annotated[Optional[List[str]], RdfProperty(VCARD.title)] = None
@@ -80,16 +115,16 @@ class VCard(VcardResource):
     language: Annotated[Optional[List[str]], RdfProperty(VCARD.language)] = None
     
     # New properties
-    has_gender: Annotated[Optional[List[str | URIRef | Gender]], RdfProperty(VCARD.hasGender)] = None
-    has_related: Annotated[Optional[List[str | URIRef | Related]], RdfProperty(VCARD.hasRelated)] = None
-    has_geo: Annotated[Optional[List[str | URIRef | Location]], RdfProperty(VCARD.hasGeo)] = None
+    has_gender: Annotated[Optional[List["str | URIRef | Gender"]], RdfProperty(VCARD.hasGender)] = None
+    has_related: Annotated[Optional[List["str | URIRef | Related"]], RdfProperty(VCARD.hasRelated)] = None
+    has_geo: Annotated[Optional[List["str | URIRef | Location"]], RdfProperty(VCARD.hasGeo)] = None
     has_sound: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasSound)] = None
     has_key: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasKey)] = None
     has_logo: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasLogo)] = None
     has_photo: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasPhoto)] = None
     has_url: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasUrl)] = None
-    has_email: Annotated[Optional[List[str | URIRef | Email]], RdfProperty(VCARD.hasEmail)] = None
-    has_telephone: Annotated[Optional[List[str | URIRef | Telephone]], RdfProperty(VCARD.hasTelephone)] = None
+    has_email: Annotated[Optional[List["str | URIRef | Email"]], RdfProperty(VCARD.hasEmail)] = None
+    has_telephone: Annotated[Optional[List["str | URIRef | Telephone"]], RdfProperty(VCARD.hasTelephone)] = None
     has_note: Annotated[Optional[List[str]], RdfProperty(VCARD.hasNote)] = None
     has_uid: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasUID)] = None
     has_language: Annotated[Optional[List[str]], RdfProperty(VCARD.hasLanguage)] = None
@@ -98,69 +133,105 @@ class VCard(VcardResource):
 class Individual(VCard):
     """An individual person."""
     
-    rdf_type: str = str(VCARD.Individual)
+    rdf_type: str = _T_INDIVIDUAL
 
 
 class Group(VCard):
     """A group of persons or entities."""
     
-    rdf_type: str = str(VCARD.Group)
+    rdf_type: str = _T_GROUP
     
-    has_member: Annotated[Optional[List[str | URIRef | VCard]], RdfProperty(VCARD.hasMember)] = None
+    has_member: Annotated[Optional[List["AnyVCard"]], RdfProperty(VCARD.hasMember)] = None
 
 
 class Organization(VCard):
     """An organization."""
     
-    rdf_type: str = str(VCARD.Organization)
+    rdf_type: str = _T_ORGANIZATION
 
 
 class Location(VCard):
     """A location."""
     
-    rdf_type: str = str(VCARD.Location)
+    rdf_type: str = _T_LOCATION
+
+
+# Tag of each VCard class, looked up by class (for instances) and by rdf_type
+# (for dicts, e.g. parsed JSON).
+_VCARD_CLASSES: Tuple[type, ...] = (VCard, Individual, Group, Organization, Location)
+_VCARD_TAGS_BY_TYPE: Dict[str, str] = {
+    cls.model_fields["rdf_type"].default: cls.__name__ for cls in _VCARD_CLASSES
+}
+_VCARD_TAGS_BY_CLASS: Dict[type, str] = {cls: cls.__name__ for cls in _VCARD_CLASSES}
+
+
+def _vcard_member_tag(value: Any) -> str:
+    """Pick the AnyVCard union member for a value without trying each one."""
+    if isinstance(value, URIRef):
+        return "URIRef"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, dict):
+        return _VCARD_TAGS_BY_TYPE.get(value.get("rdf_type"), "VCard")
+    return _VCARD_TAGS_BY_CLASS.get(type(value), "VCard")
+
+
+# A vCard reference: a URI or an inline VCard, validated as the VCard subclass
+# matching its rdf_type (a tagged union dispatched by pydantic-core).
+AnyVCard = Annotated[
+    Union[
+        Annotated[URIRef, Tag("URIRef")],
+        Annotated[str, Tag("str")],
+        Annotated[VCard, Tag("VCard")],
+        Annotated[Individual, Tag("Individual")],
+        Annotated[Group, Tag("Group")],
+        Annotated[Organization, Tag("Organization")],
+        Annotated[Location, Tag("Location")],
+    ],
+    Discriminator(_vcard_member_tag),
+]
 
 
 class Name(VcardResource):
     """A name component."""
     
-    rdf_type: str = str(VCARD.Name)
+    rdf_type: str = _T_NAME
     
-    family_name: Annotated[Optional[List[str]], RdfProperty(VCARD["family-name"])] = None
-    given_name: Annotated[Optional[List[str]], RdfProperty(VCARD["given-name"])] = None
-    additional_name: Annotated[Optional[List[str]], RdfProperty(VCARD["additional-name"])] = None
-    honorific_prefix: Annotated[Optional[List[str]], RdfProperty(VCARD["honorific-prefix"])] = None
-    honorific_suffix: Annotated[Optional[List[str]], RdfProperty(VCARD["honorific-suffix"])] = None
+    family_name: Annotated[Optional[List[str]], RdfProperty(_FAMILY_NAME)] = None
+    given_name: Annotated[Optional[List[str]], RdfProperty(_GIVEN_NAME)] = None
+    additional_name: Annotated[Optional[List[str]], RdfProperty(_ADDITIONAL_NAME)] = None
+    honorific_prefix: Annotated[Optional[List[str]], RdfProperty(_HONORIFIC_PREFIX)] = None
+    honorific_suffix: Annotated[Optional[List[str]], RdfProperty(_HONORIFIC_SUFFIX)] = None
 
 
 class Address(VcardResource):
     """A delivery address."""
     
-    rdf_type: str = str(VCARD.Address)
+    rdf_type: str = _T_ADDRESS
     
-    street_address: Annotated[Optional[List[str]], RdfProperty(VCARD["street-address"])] = None
+    street_address: Annotated[Optional[List[str]], RdfProperty(_STREET_ADDRESS)] = None
     locality: Annotated[Optional[List[str]], RdfProperty(VCARD.locality)] = None
     region: Annotated[Optional[List[str]], RdfProperty(VCARD.region)] = None
-    postal_code: Annotated[Optional[List[str]], RdfProperty(VCARD["postal-code"])] = None
-    country_name: Annotated[Optional[List[str]], RdfProperty(VCARD["country-name"])] = None
-    post_office_box: Annotated[Optional[List[str]], RdfProperty(VCARD["post-office-box"])] = None
-    extended_address: Annotated[Optional[List[str]], RdfProperty(VCARD["extended-address"])] = None
+    postal_code: Annotated[Optional[List[str]], RdfProperty(_POSTAL_CODE)] = None
+    country_name: Annotated[Optional[List[str]], RdfProperty(_COUNTRY_NAME)] = None
+    post_office_box: Annotated[Optional[List[str]], RdfProperty(_POST_OFFICE_BOX)] = None
+    extended_address: Annotated[Optional[List[str]], RdfProperty(_EXTENDED_ADDRESS)] = None
 
 
 class Telephone(VcardResource):
     """A telephone number."""
     
-    rdf_type: str = str(VCARD.Telephone)
+    rdf_type: str = _T_TELEPHONE
     
-    has_value: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasValue)] = None
+    has_value: Annotated[Optional[List[str | URIRef]], _P_HAS_VALUE] = None
 
 
 class Email(VcardResource):
     """An email address."""
     
-    rdf_type: str = str(VCARD.Email)
+    rdf_type: str = _T_EMAIL
     
-    has_value: Annotated[Optional[List[str | URIRef]], RdfProperty(VCARD.hasValue)] = None
+    has_value: Annotated[Optional[List[str | URIRef]], _P_HAS_VALUE] = None
 
 __all__ = [
     "VcardResource",
@@ -178,6 +249,8 @@ __all__ = [
     "AddressType",
     "Gender",
     "Related",
+    "VCARD_RELATED_KINDS",
+    "AnyVCard",
     "Acquaintance",
     "Friend",
     "Parent",
@@ -196,109 +269,242 @@ __all__ = [
 ]
 
 
-class TelephoneType(VcardResource):
-    """Telephone type classifications."""
-    pass
+class _VcardTypeEnum(IntEnum):
+    """Base for the vCard type enumerations.
+    
+    Members are small integers (cheap to compare, store and dump); the
+    matching ``vcard:`` term is available as :attr:`uri`.
+    """
+    
+    @property
+    def uri(self) -> URIRef:
+        """The vCard term of this type, e.g. ``vcard:Cell``."""
+        return _VCARD_TYPE_URIS[type(self), self.value]
+    
+    @classmethod
+    def from_uri(cls, uri: Union[str, URIRef]) -> "_VcardTypeEnum":
+        """Look up the member for a vCard term URI."""
+        try:
+            return _VCARD_TYPES_BY_URI[cls, str(uri)]
+        except KeyError:
+            raise ValueError(f"{uri!r} is not a {cls.__name__} term") from None
+
+
+class TelephoneType(_VcardTypeEnum):
+    """Telephone type classifications (``vcard:TelephoneType``)."""
+    
+    VOICE = 0
+    FAX = 1
+    CELL = 2
+    VIDEO = 3
+    PAGER = 4
+    TEXT = 5
+    TEXT_PHONE = 6
+
+
+class EmailType(_VcardTypeEnum):
+    """Email type classifications (deprecated ``vcard:Email`` subclasses)."""
+    
+    INTERNET = 0
+    X400 = 1
 
 
-class EmailType(VcardResource):
-    """Email type classifications."""
-    pass
+class AddressType(_VcardTypeEnum):
+    """Address type classifications (deprecated ``vcard:Address`` subclasses)."""
+    
+    DOM = 0
+    INTL = 1
+    PARCEL = 2
+    POSTAL = 3
 
 
-class AddressType(VcardResource):
-    """Address type classifications."""
-    pass
+# Member -> term lookups, keyed by (enum class, value) since IntEnum members of
+# different enumerations compare (and hash) equal by value.
+_VCARD_TYPE_URIS: Dict[Tuple[type, int], URIRef] = {
+    (enum, member.value): VCARD["".join(part.capitalize() for part in member.name.split("_"))]
+    for enum in (TelephoneType, EmailType, AddressType)
+    for member in enum
+}
+_VCARD_TYPES_BY_URI: Dict[Tuple[type, str], _VcardTypeEnum] = {
+    (enum, str(uri)): enum(value) for (enum, value), uri in _VCARD_TYPE_URIS.items()
+}
 
 
 class Gender(VcardResource):
     """A gender."""
     
-    rdf_type: str = str(VCARD.Gender)
+    rdf_type: str = _T_GENDER
     
     sex: Annotated[Optional[List[str]], RdfProperty(VCARD.sex)] = None
     identity: Annotated[Optional[List[str]], RdfProperty(VCARD.identity)] = None
 
 
+# Relation kinds (subclasses of vcard:Related), keyed by local name.
+VCARD_RELATED_KINDS: Dict[str, URIRef] = {
+    "Acquaintance": VCARD.Acquaintance,
+    "Friend": VCARD.Friend,
+    "Parent": VCARD.Parent,
+    "Child": VCARD.Child,
+    "Spouse": VCARD.Spouse,
+    "Sibling": VCARD.Sibling,
+    "Kin": VCARD.Kin,
+    "Colleague": VCARD.Colleague,
+    "Emergency": VCARD.Emergency,
+    "Agent": VCARD.Agent,
+    "CoResident": VCARD.CoResident,
+    "Neighbor": VCARD.Neighbor,
+    "Coworker": VCARD.Coworker,
+}
+_RELATED_KIND_TYPES: Dict[str, str] = {
+    kind: sys.intern(str(uri)) for kind, uri in VCARD_RELATED_KINDS.items()
+}
+
+
 class Related(VcardResource):
-    """A related entity."""
-    
-    rdf_type: str = str(VCARD.Related)
-    
-    has_value: Annotated[Optional[List[str | URIRef | VCard]], RdfProperty(VCARD.hasValue)] = None
+    """A related entity.
+
+    Specific relation kinds (``vcard:Friend``, ``vcard:Colleague``, ...) are
+    the subclasses below; :meth:`of_kind` picks one by name. Reading a
+    resource through ``Related`` returns the subclass matching its rdf:type.
+    """
+    
+    rdf_type: str = _T_RELATED
+    
+    has_value: Annotated[Optional[List["AnyVCard"]], _P_HAS_VALUE] = None
+
+    @classmethod
+    def of_kind(cls, kind: str, **values: Any) -> "Related":
+        """Create a related entity typed with the vCard relation ``kind``.
+
+        Parameters
+        ----------
+        kind:
+            Local name of the relation class, e.g. ``"Friend"``. See
+            :data:`VCARD_RELATED_KINDS` for the supported values.
+        **values:
+            Field values passed to the model constructor.
+        """
+        try:
+            kind_cls = _RELATED_KIND_CLASSES[kind]
+        except KeyError:
+            raise ValueError(f"Unknown vCard relation kind: {kind!r}") from None
+        return kind_cls(**values)
+
+    @classmethod
+    def from_rdf_graph(
+        cls, graph: Graph, subject: Union[URIRef, str], *, base_uri: Optional[str] = None,
+        validate: bool = True
+    ) -> "Related":
+        if cls is Related:
+            for rdf_type in graph.objects(URIRef(str(subject)), RDF.type):
+                kind_cls = _RELATED_CLASSES_BY_TYPE.get(str(rdf_type))
+                if kind_cls is not None and kind_cls is not Related:
+                    return kind_cls.from_rdf_graph(graph, subject, base_uri=base_uri, validate=validate)
+        return super().from_rdf_graph(graph, subject, base_uri=base_uri, validate=validate)
+
+    @classmethod
+    def _infer_subject(cls, graph: Graph) -> Optional[URIRef]:
+        if cls is not Related:
+            return super()._infer_subject(graph)
+        # Plain vcard:Related resources and every relation kind.
+        return _sole_subject(
+            (s for rdf_type in _RELATED_CLASSES_BY_TYPE for s in graph.subjects(RDF.type, URIRef(rdf_type))),
+            "Multiple related resources were found; provide the subject explicitly.",
+        )
 
 
 class Acquaintance(Related):
     """An acquaintance."""
-    rdf_type: str = str(VCARD.Acquaintance)
+    rdf_type: str = _RELATED_KIND_TYPES["Acquaintance"]
 
 
 class Friend(Related):
     """A friend."""
-    rdf_type: str = str(VCARD.Friend)
+    rdf_type: str = _RELATED_KIND_TYPES["Friend"]
 
 
 class Parent(Related):
     """A parent."""
-    rdf_type: str = str(VCARD.Parent)
+    rdf_type: str = _RELATED_KIND_TYPES["Parent"]
 
 
 class Child(Related):
     """A child."""
-    rdf_type: str = str(VCARD.Child)
+    rdf_type: str = _RELATED_KIND_TYPES["Child"]
 
 
 class Spouse(Related):
     """A spouse."""
-    rdf_type: str = str(VCARD.Spouse)
+    rdf_type: str = _RELATED_KIND_TYPES["Spouse"]
 
 
 class Sibling(Related):
     """A sibling."""
-    rdf_type: str = str(VCARD.Sibling)
+    rdf_type: str = _RELATED_KIND_TYPES["Sibling"]
 
 
 class Kin(Related):
     """A kin."""
-    rdf_type: str = str(VCARD.Kin)
+    rdf_type: str = _RELATED_KIND_TYPES["Kin"]
 
 
 class Colleague(Related):
     """A colleague."""
-    rdf_type: str = str(VCARD.Colleague)
+    rdf_type: str = _RELATED_KIND_TYPES["Colleague"]
 
 
 class Emergency(Related):
     """An emergency contact."""
-    rdf_type: str = str(VCARD.Emergency)
+    rdf_type: str = _RELATED_KIND_TYPES["Emergency"]
 
 
 class Agent(Related):
     """An agent."""
-    rdf_type: str = str(VCARD.Agent)
+    rdf_type: str = _RELATED_KIND_TYPES["Agent"]
 
 
 class CoResident(Related):
     """A co-resident."""
-    rdf_type: str = str(VCARD.CoResident)
+    rdf_type: str = _RELATED_KIND_TYPES["CoResident"]
 
 
 class Neighbor(Related):
     """A neighbor."""
-    rdf_type: str = str(VCARD.Neighbor)
+    rdf_type: str = _RELATED_KIND_TYPES["Neighbor"]
 
 
 class Coworker(Related):
     """A coworker."""
-    rdf_type: str = str(VCARD.Coworker)
+    rdf_type: str = _RELATED_KIND_TYPES["Coworker"]
+
+
+_RELATED_KIND_CLASSES: Dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        Acquaintance, Friend, Parent, Child, Spouse, Sibling, Kin, Colleague, Emergency, Agent,
+        CoResident, Neighbor, Coworker,
+    )
+}
+_RELATED_CLASSES_BY_TYPE: Dict[str, type] = {
+    _T_RELATED: Related,
+    **{_RELATED_KIND_TYPES[kind]: kind_cls for kind, kind_cls in _RELATED_KIND_CLASSES.items()},
+}
 
 
 class Kind(VcardResource):
     """A kind of vCard."""
-    rdf_type: str = str(VCARD.Kind)
+    rdf_type: str = _T_KIND
 
 
 class Type(VcardResource):
     """A property type."""
-    rdf_type: str = str(VCARD.Type)
+    rdf_type: str = _T_TYPE
+
 
+# Resolve forward references once at import time: the leaf types above are
+# already complete, so only the VCard hierarchy needs rebuilding.
+VCard.model_rebuild()
+Individual.model_rebuild()
+Group.model_rebuild()
+Organization.model_rebuild()
+Location.model_rebuild()
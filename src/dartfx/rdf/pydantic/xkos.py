@@ -10,17 +10,39 @@ References:
 """
 
 from __future__ import annotations
-from typing import Annotated, List, Optional
+
+import sys
+from typing import Annotated, Iterator, List, Optional, Union
 
 from rdflib import Namespace, URIRef, SKOS
 
 from ._base import RdfBaseModel, RdfProperty
+from .skos import (
+    _P_BROADER, _P_DEFINITION, _P_HAS_TOP_CONCEPT, _P_IN_SCHEME, _P_NARROWER, _P_NOTATION, _P_NOTE,
+    _P_RELATED, _P_SCOPE_NOTE, _P_TOP_CONCEPT_OF, _SkosLabeled, _iter_transitive,
+)
 
 
 # XKOS namespace
 XKOS = Namespace("http://rdf-vocabulary.ddialliance.org/xkos#")
 
 
+# rdf:type values, interned so that every instance shares one string.
+_T_CLASSIFICATION_LEVEL = sys.intern(str(XKOS.ClassificationLevel))
+_T_CONCEPT_ASSOCIATION = sys.intern(str(XKOS.ConceptAssociation))
+_T_CORRESPONDENCE = sys.intern(str(XKOS.Correspondence))
+_T_EXPLANATORY_NOTE = sys.intern(str(XKOS.ExplanatoryNote))
+_T_SKOS_CONCEPT = sys.intern(str(SKOS.Concept))
+_T_SKOS_CONCEPT_SCHEME = sys.intern(str(SKOS.ConceptScheme))
+
+# Descriptors shared by several classes; RdfProperty is immutable.
+_P_FOLLOWS = RdfProperty(XKOS.follows)
+_P_DISJOINT = RdfProperty(XKOS.disjoint)
+_P_INTRODUCTION = RdfProperty(XKOS.introduction)
+_P_EDITORIAL_NOTE = RdfProperty(XKOS.editorialNote)
+_P_CHANGE_NOTE = RdfProperty(XKOS.changeNote)
+
+
 class XkosResource(RdfBaseModel):
     """Base class for XKOS resources."""
     
@@ -28,10 +50,10 @@ class XkosResource(RdfBaseModel):
     rdf_prefixes = {"xkos": XKOS, "skos": SKOS}
 
 
-class ClassificationLevel(XkosResource):
+class ClassificationLevel(XkosResource, _SkosLabeled):
     """An XKOS Classification Level - a level in a statistical classification."""
     
-    rdf_type: str = str(XKOS.ClassificationLevel)
+    rdf_type: str = _T_CLASSIFICATION_LEVEL
     
     # Level properties
     depth: Annotated[Optional[List[int]], RdfProperty(XKOS.depth)] = None
@@ -46,38 +68,30 @@ class ClassificationLevel(XkosResource):
     notation_pattern: Annotated[Optional[List[str]], RdfProperty(XKOS.notationPattern)] = None
     max_length: Annotated[Optional[List[int]], RdfProperty(XKOS.maxLength)] = None
     
-    # Labels (from SKOS)
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
-    
     # Notes
-    note: Annotated[Optional[List[str]], RdfProperty(SKOS.note)] = None
+    note: Annotated[Optional[List[str]], _P_NOTE] = None
 
 
 class ConceptAssociation(XkosResource):
     """An XKOS Concept Association - a relationship between concepts in different classifications."""
     
-    rdf_type: str = str(XKOS.ConceptAssociation)
+    rdf_type: str = _T_CONCEPT_ASSOCIATION
     
     # Source and target
     source_concept: Annotated[Optional[List[str | URIRef]], RdfProperty(XKOS.sourceConcept)] = None
     target_concept: Annotated[Optional[List[str | URIRef]], RdfProperty(XKOS.targetConcept)] = None
 
 
-class Correspondence(XkosResource):
+class Correspondence(XkosResource, _SkosLabeled):
     """An XKOS Correspondence - a mapping between two classifications."""
     
-    rdf_type: str = str(XKOS.Correspondence)
+    rdf_type: str = _T_CORRESPONDENCE
     
     # Source and target classifications
     compares: Annotated[Optional[List[str | URIRef]], RdfProperty(XKOS.compares)] = None
     
-    # Labels
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
-    
     # Definition
-    definition: Annotated[Optional[List[str]], RdfProperty(SKOS.definition)] = None
+    definition: Annotated[Optional[List[str]], _P_DEFINITION] = None
     
     # Associations
     made_of: Annotated[Optional[List[str | URIRef | ConceptAssociation]], RdfProperty(XKOS.madeOf)] = None
@@ -86,33 +100,30 @@ class Correspondence(XkosResource):
 class ExplanatoryNote(XkosResource):
     """An XKOS Explanatory Note - additional documentation for a concept."""
     
-    rdf_type: str = str(XKOS.ExplanatoryNote)
+    rdf_type: str = _T_EXPLANATORY_NOTE
     
     # Descriptive text
     plain_text: Annotated[Optional[List[str]], RdfProperty(XKOS.plainText)] = None
 
 
 # Extended SKOS Concept for statistical classifications
-class StatisticalConcept(XkosResource):
+class StatisticalConcept(XkosResource, _SkosLabeled):
     """A SKOS Concept with XKOS extensions for statistical classifications."""
     
-    rdf_type: str = str(SKOS.Concept)
+    rdf_type: str = _T_SKOS_CONCEPT
     
     # SKOS properties
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
-    hidden_label: Annotated[Optional[List[str]], RdfProperty(SKOS.hiddenLabel)] = None
-    notation: Annotated[Optional[List[str]], RdfProperty(SKOS.notation)] = None
-    definition: Annotated[Optional[List[str]], RdfProperty(SKOS.definition)] = None
+    notation: Annotated[Optional[List[str]], _P_NOTATION] = None
+    definition: Annotated[Optional[List[str]], _P_DEFINITION] = None
     
     # SKOS semantic relations
-    broader: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(SKOS.broader)] = None
-    narrower: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(SKOS.narrower)] = None
-    related: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(SKOS.related)] = None
+    broader: Annotated[Optional[List[str | URIRef | StatisticalConcept]], _P_BROADER] = None
+    narrower: Annotated[Optional[List[str | URIRef | StatisticalConcept]], _P_NARROWER] = None
+    related: Annotated[Optional[List[str | URIRef | StatisticalConcept]], _P_RELATED] = None
     
     # Concept scheme
-    in_scheme: Annotated[Optional[List[str | URIRef]], RdfProperty(SKOS.inScheme)] = None
-    top_concept_of: Annotated[Optional[List[str | URIRef]], RdfProperty(SKOS.topConceptOf)] = None
+    in_scheme: Annotated[Optional[List[str | URIRef]], _P_IN_SCHEME] = None
+    top_concept_of: Annotated[Optional[List[str | URIRef]], _P_TOP_CONCEPT_OF] = None
     
     # XKOS extensions
     core_content_note: Annotated[Optional[List[str]], RdfProperty(XKOS.coreContentNote)] = None
@@ -128,7 +139,7 @@ class StatisticalConcept(XkosResource):
     # Sequential relationships
     sequential: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.sequential)] = None
     precedes: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.precedes)] = None
-    follows: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.follows)] = None
+    follows: Annotated[Optional[List[str | URIRef | StatisticalConcept]], _P_FOLLOWS] = None
     
     # Temporal relationships
     temporal: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.temporal)] = None
@@ -147,33 +158,36 @@ class StatisticalConcept(XkosResource):
     class_at: Annotated[Optional[List[str | URIRef | ClassificationLevel]], RdfProperty(XKOS.classifiedUnder)] = None
     
     # Concept relations
-    disjoint: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.disjoint)] = None
+    disjoint: Annotated[Optional[List[str | URIRef | StatisticalConcept]], _P_DISJOINT] = None
     broader_generic: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.broaderGeneric)] = None
     narrower_generic: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.narrowerGeneric)] = None
     broader_partitive: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.broaderPartitive)] = None
     narrower_partitive: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(XKOS.narrowerPartitive)] = None
     
     # Notes
-    introduction: Annotated[Optional[List[str]], RdfProperty(XKOS.introduction)] = None
-    editorial_note: Annotated[Optional[List[str]], RdfProperty(XKOS.editorialNote)] = None
-    change_note: Annotated[Optional[List[str]], RdfProperty(XKOS.changeNote)] = None
+    introduction: Annotated[Optional[List[str]], _P_INTRODUCTION] = None
+    editorial_note: Annotated[Optional[List[str]], _P_EDITORIAL_NOTE] = None
+    change_note: Annotated[Optional[List[str]], _P_CHANGE_NOTE] = None
 
+    def iter_transitive(self, relation: str = "broader") -> Iterator[Union[str, URIRef, StatisticalConcept]]:
+        """Walk a relation (``"broader"``, ``"has_part"``, ...) transitively, breadth-first.
+        
+        See :meth:`dartfx.rdf.pydantic.skos.Concept.iter_transitive`.
+        """
+        return _iter_transitive(self, relation)
 
-class StatisticalClassification(XkosResource):
+
+class StatisticalClassification(XkosResource, _SkosLabeled):
     """A SKOS Concept Scheme representing a statistical classification."""
     
-    rdf_type: str = str(SKOS.ConceptScheme)
-    
-    # Labels
-    pref_label: Annotated[Optional[List[str]], RdfProperty(SKOS.prefLabel)] = None
-    alt_label: Annotated[Optional[List[str]], RdfProperty(SKOS.altLabel)] = None
+    rdf_type: str = _T_SKOS_CONCEPT_SCHEME
     
     # Definition and scope
-    definition: Annotated[Optional[List[str]], RdfProperty(SKOS.definition)] = None
-    scope_note: Annotated[Optional[List[str]], RdfProperty(SKOS.scopeNote)] = None
+    definition: Annotated[Optional[List[str]], _P_DEFINITION] = None
+    scope_note: Annotated[Optional[List[str]], _P_SCOPE_NOTE] = None
     
     # Top concepts
-    has_top_concept: Annotated[Optional[List[str | URIRef | StatisticalConcept]], RdfProperty(SKOS.hasTopConcept)] = None
+    has_top_concept: Annotated[Optional[List[str | URIRef | StatisticalConcept]], _P_HAS_TOP_CONCEPT] = None
     
     # XKOS properties
     number_of_levels: Annotated[Optional[List[int]], RdfProperty(XKOS.numberOfLevels)] = None
@@ -184,14 +198,14 @@ class StatisticalClassification(XkosResource):
     belongs_to: Annotated[Optional[List[str | URIRef]], RdfProperty(XKOS.belongsTo)] = None
     
     # Versioning
-    follows: Annotated[Optional[List[str | URIRef | StatisticalClassification]], RdfProperty(XKOS.follows)] = None
+    follows: Annotated[Optional[List[str | URIRef | StatisticalClassification]], _P_FOLLOWS] = None
     supersedes: Annotated[Optional[List[str | URIRef | StatisticalClassification]], RdfProperty(XKOS.supersedes)] = None
     succeeds: Annotated[Optional[List[str | URIRef | StatisticalClassification]], RdfProperty(XKOS.succeeds)] = None
     
     # Relations
-    disjoint: Annotated[Optional[List[str | URIRef | StatisticalClassification]], RdfProperty(XKOS.disjoint)] = None
+    disjoint: Annotated[Optional[List[str | URIRef | StatisticalClassification]], _P_DISJOINT] = None
     
     # Notes
-    introduction: Annotated[Optional[List[str]], RdfProperty(XKOS.introduction)] = None
-    editorial_note: Annotated[Optional[List[str]], RdfProperty(XKOS.editorialNote)] = None
-    change_note: Annotated[Optional[List[str]], RdfProperty(XKOS.changeNote)] = None
+    introduction: Annotated[Optional[List[str]], _P_INTRODUCTION] = None
+    editorial_note: Annotated[Optional[List[str]], _P_EDITORIAL_NOTE] = None
+    change_note: Annotated[Optional[List[str]], _P_CHANGE_NOTE] = None
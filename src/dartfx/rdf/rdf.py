@@ -1,17 +1,99 @@
 from dataclasses import asdict, dataclass, field, fields
 from datetime import date, datetime
 from enum import Enum, auto
-from functools import cache
+from functools import cache, lru_cache, partial
 import json
 import logging
 import re
-from typing import Any, Collection, Optional, Union, get_args, get_origin, get_type_hints
+from typing import Any, Optional, Union, get_args, get_origin, get_type_hints
 from urllib.parse import urlparse
 import uuid
 from rdflib import RDF, XSD, Graph, Literal, URIRef
-import sys
 
-@dataclass
+_LANG_RE = re.compile(r'^[a-zA-Z]{1,8}(-[a-zA-Z0-9]{1,8})*$')
+_URN_RE = re.compile(r'^urn:[a-zA-Z0-9][a-zA-Z0-9-]{0,31}:[a-zA-Z0-9()+,\-.:=@;$_!*\'%/?#]+$')
+
+@lru_cache(maxsize=None)
+def _class_type_hints(cls) -> dict:
+    """Returns the type hints of a class, evaluated once per class.
+    
+    get_type_hints resolves string (forward reference) annotations against the module of
+    the class declaring each attribute, including those nested in list[...].
+    """
+    return get_type_hints(cls)
+
+# values whose Literal is shared between identical leaves
+# (not floats or datetimes: equal values such as 0.0 and -0.0 can have different lexical forms)
+_INTERNED_LITERAL_TYPES = (str, int, bool)
+
+@lru_cache(maxsize=8192, typed=True)
+def _interned_literal(value, datatype, lang) -> Literal:
+    return Literal(value, datatype=datatype, lang=lang)
+
+def _make_literal(value, datatype=None, lang=None) -> Literal:
+    """Returns an RDF Literal, reusing the same object for repeated (value, datatype, lang) leaves.
+    
+    The cache is typed, so 1 and True remain distinct values.
+    """
+    if isinstance(value, _INTERNED_LITERAL_TYPES):
+        return _interned_literal(value, datatype, lang)
+    return Literal(value, datatype=datatype, lang=lang)
+
+def _emit_resources(values, g: Graph, buffer: dict, emitted: set, pending: list):
+    nodes = []
+    for value in values:
+        if type(value).add_to_rdf_graph is RdfResource.add_to_rdf_graph:
+            # the resource triples are added by the caller, from the pending list
+            nodes.append(value.get_uriref())
+            pending.append(value)
+        else:
+            # value-like resources (strings, URIs, ...) return their RDF object
+            nodes.append(value.add_to_rdf_graph(g, _buffer=buffer, _emitted=emitted))
+    return nodes
+
+def _emit_literals(values, g: Graph, buffer: dict, emitted: set, pending: list):
+    return [_make_literal(value) for value in values]
+
+def _emit_isoformats(datatype, values, g: Graph, buffer: dict, emitted: set, pending: list):
+    return [_make_literal(value.isoformat(), datatype) for value in values]
+
+def _emit_typed_literals(datatype, values, g: Graph, buffer: dict, emitted: set, pending: list):
+    return [_make_literal(value, datatype) for value in values]
+
+# RDF objects builders for attribute classes, looked up along the class MRO
+_VALUES_BUILDERS = {
+    str: partial(_emit_typed_literals, XSD.string),
+    int: partial(_emit_typed_literals, XSD.integer),
+    float: partial(_emit_typed_literals, XSD.float),
+    bool: partial(_emit_typed_literals, XSD.boolean),
+    datetime: partial(_emit_isoformats, XSD.dateTime),
+    date: partial(_emit_isoformats, XSD.date),
+}
+
+def _values_builder(cls):
+    """Returns the callable turning a list of values of the attribute class into a list of RDF objects."""
+    if not isinstance(cls, type):
+        return _emit_literals
+    if issubclass(cls, RdfResource):
+        return _emit_resources
+    for base in cls.__mro__:
+        if base in _VALUES_BUILDERS:
+            return _VALUES_BUILDERS[base]
+    return _emit_literals
+
+def _emit_rdf_list(buffer: dict, g: Graph, head: URIRef, objects: list):
+    """Adds the rdf:first/rdf:rest chain of an RDF list starting at head to the buffer.
+    
+    The list nodes after the head are URIRefs derived from it (head_1, head_2, ...), not blank nodes.
+    """
+    node = head
+    for index, object in enumerate(objects, start=1):
+        next_node = URIRef(f"{head}_{index}") if index < len(objects) else RDF.nil
+        buffer[(node, RDF.first, object, g)] = None
+        buffer[(node, RDF.rest, next_node, g)] = None
+        node = next_node
+
+@dataclass(slots=True)
 class AttributeInfo:
     """
     Helper class to capture the information on an attribute.
@@ -37,12 +119,17 @@ class RdfResource:
     def __init__(self):
         self.g = Graph()
 
+    def __post_init__(self):
+        """No-op end of the __post_init__ chain, so subclasses can always call super().__post_init__()."""
+        pass
+
     @classmethod
     @cache
-    def _get_attribute_info(cls, attribute_name:str) -> AttributeInfo:
-        """Internal helper that infers information on an attribute type for instantiaion and processing.
+    def _attribute_infos(cls) -> dict:
+        """Internal helper that infers information on the attribute types for instantiaion and processing.
 
         Relies on dataclasses attribute annotations and Python typing package introspection.
+        All the attributes of the class are processed at once, and the result is cached per class.
         
         Note that we use the attribute field(...) 'metadata' to capture information specific to the DDI-CDI model
 
@@ -55,56 +142,83 @@ class RdfResource:
         #   --> origin is typing.Union
         #   --> args is the tuple (typinglist['ObjectName'], <class 'NoneType'>)
         #
-        attribute_info= AttributeInfo(name=attribute_name)
-        # Field information
-        try:
-            field_info = next(f for f in fields(cls) if f.name == attribute_name)
-        except StopIteration:
-            raise Exception(f"{attribute_name} attribute not found on {cls.__name__}")
-        attribute_info.metadata = field_info.metadata
-        # Type hints
-        attribute_type_hints = get_type_hints(cls).get(attribute_name)
-        if attribute_type_hints:
-            origin = get_origin(attribute_type_hints)
-            args = list(get_args(attribute_type_hints)) # we make the args tuple a list so we can remove the None class
-            if origin is Union: 
-                if None.__class__ in args:
-                    attribute_info.is_optional = True
-                    args.remove(None.__class__) # remove the None class
-                else:
-                    attribute_info.is_optional = False
-                # At this point, only one type should be left
-                # It could be a list
-                if len(args) == 1:
-                    attribute_type_hints = args[0]
-                    origin = get_origin(attribute_type_hints)
-                    args = list(get_args(attribute_type_hints))
-                else:
-                    # More than one type is possible
-                    # ... but we do not currently support this
-                    raise Exception(f"More than one type found for {attribute_type_hints}")
-        else:
-            # This attributes does not exists on the class
-            # Just ignore and return None
-            logging.warning(f"No '{attribute_name}' attribute found on {cls.__name__}")
-            return None
-        # detect if this is a list or a single value
-        attribute_info.is_list = True if origin is list else False
-        if attribute_info.is_list:
-            attribute_info.cls = args[0]
-        else:
-            attribute_info.cls = attribute_type_hints
-        # If the type was defined using a ForwardRef, 
-        # convert the string value to a class 
-        if isinstance(attribute_info.cls, str):
-            local_class = locals()['cls'] # this return the class holding the attribute
-            module_name = local_class.__module__ # this is the name of the wrapping class module (e.g. dartfx.dcat.dcat)
-            # Get the class from sys.modules
-            # https://stackoverflow.com/questions/1176136/convert-string-to-python-class-object
-            attribute_info.cls = getattr(sys.modules[module_name], attribute_info.cls)
+        type_hints = _class_type_hints(cls)
+        attribute_infos = {}
+        for field_info in fields(cls):
+            attribute_name = field_info.name
+            attribute_info= AttributeInfo(name=attribute_name)
+            # Field information
+            attribute_info.metadata = field_info.metadata
+            # Type hints
+            attribute_type_hints = type_hints.get(attribute_name)
+            if attribute_type_hints:
+                origin = get_origin(attribute_type_hints)
+                args = list(get_args(attribute_type_hints)) # we make the args tuple a list so we can remove the None class
+                if origin is Union: 
+                    if None.__class__ in args:
+                        attribute_info.is_optional = True
+                        args.remove(None.__class__) # remove the None class
+                    else:
+                        attribute_info.is_optional = False
+                    # At this point, only one type should be left
+                    # It could be a list
+                    if len(args) == 1:
+                        attribute_type_hints = args[0]
+                        origin = get_origin(attribute_type_hints)
+                        args = list(get_args(attribute_type_hints))
+                    else:
+                        # More than one type is possible
+                        # ... but we do not currently support this
+                        raise Exception(f"More than one type found for {attribute_type_hints}")
+            else:
+                # This attributes does not exists on the class
+                # Just ignore and record None
+                logging.warning(f"No '{attribute_name}' attribute found on {cls.__name__}")
+                attribute_infos[attribute_name] = None
+                continue
+            # detect if this is a list or a single value
+            attribute_info.is_list = True if origin is list else False
+            if attribute_info.is_list:
+                attribute_info.cls = args[0]
+            else:
+                attribute_info.cls = attribute_type_hints
+            attribute_infos[attribute_name] = attribute_info
         # Done
-        return attribute_info
+        return attribute_infos
 
+    @classmethod
+    def _get_attribute_info(cls, attribute_name:str) -> AttributeInfo:
+        """Internal helper that returns the information on an attribute type (see _attribute_infos)."""
+        attribute_infos = cls._attribute_infos()
+        if attribute_name not in attribute_infos:
+            raise Exception(f"{attribute_name} attribute not found on {cls.__name__}")
+        return attribute_infos[attribute_name]
+
+
+    @classmethod
+    @cache
+    def _serialization_plan(cls, namespace) -> tuple:
+        """Internal helper that lists the triples add_to_rdf_graph(...) serializes.
+
+        Computed once per class and resource namespace: a (rdf_type, entries) pair where rdf_type is
+        the class URIRef and entries is a tuple of (AttributeInfo, predicate, builder) for the public
+        attributes. The predicate is based on the attribute name and the attribute metadata namespace
+        override, or the resource namespace (None if that namespace does not define the term).
+        The builder turns the list of values of the attribute into RDF objects.
+        """
+        entries = []
+        for attribute in fields(cls):
+            # skip private attributes
+            if attribute.name.startswith("_"):
+                continue
+            attribute_info = cls._get_attribute_info(attribute.name)
+            try:
+                predicate = attribute.metadata.get("namespace", namespace)[attribute.name]
+            except (AttributeError, KeyError):
+                # term not defined in a closed namespace: only fails if the attribute has a value
+                predicate = None
+            entries.append((attribute_info, predicate, _values_builder(attribute_info.cls)))
+        return namespace[cls.__name__], tuple(entries)
 
     def add_resource(self, resource, attribute_name:str = None, exact_match:bool = True):
         """A singular version of add_resources(...)
@@ -201,7 +315,7 @@ class RdfResource:
     def set_namespace(self, namespace: str):
         self.namespace = namespace
 
-    def add_to_rdf_graph(self, g:Graph, use_list=False) -> URIRef:
+    def add_to_rdf_graph(self, g:Graph, use_list=False, _buffer:dict = None, _emitted:set = None) -> URIRef:
         """ 
         Add this resource to an RDF graph.
         
@@ -213,6 +327,33 @@ class RdfResource:
         - Attributes starting with an underscore are ignored
         - The attribute namespace is the same as the resource, unless overridden in the attribute metadata
         
+        The triples of this resource and of the resources it references are collected in an
+        insertion-ordered dict of quads (the internal _buffer argument) and added with a single g.addN(...).
+        The subjects already serialized during the call are tracked in the internal _emitted set,
+        and referenced resources are processed from a work list, so deep hierarchies do not recurse.
+        
+        """
+        if _buffer is None:
+            # if resource is already in the graph, just return the reference
+            if self._namespace and (self.get_uriref(), RDF.type, self._namespace[self.__class__.__name__]) in g:
+                return self.get_uriref()
+            _buffer = {}
+            subject = self.add_to_rdf_graph(g, use_list, _buffer, set())
+            g.addN(_buffer)
+            return subject
+        # serialize this resource, then the resources it references (iteratively, not recursively)
+        pending = [self]
+        while pending:
+            resource = pending.pop()
+            # nested resources are serialized without RDF lists
+            resource._add_triples(g, use_list and resource is self, _buffer, _emitted, pending)
+        # return the URIRef                
+        return self.get_uriref()
+
+    def _add_triples(self, g:Graph, use_list:bool, _buffer:dict, _emitted:set, _pending:list):
+        """Internal helper that adds the triples of this resource to the buffer.
+        
+        The referenced resources are appended to the _pending list for the caller to process.
         """
         # check namespace
         if not self._namespace:
@@ -221,73 +362,63 @@ class RdfResource:
             namespace = self._namespace
         # create the resource subject
         subject = self.get_uriref()
-        triple = (subject, RDF.type, namespace[self.__class__.__name__])
-        # if resource is already in the graph, just return the reference
-        if triple in g:
-            return subject
-        #logging.debug(f"Adding {triple[0]} {triple[2]} to RDF graph") 
-        g.add(triple)
+        # if resource has already been serialized, there is nothing to add
+        if subject in _emitted:
+            return
+        _emitted.add(subject)
+        rdf_type, plan = self._serialization_plan(namespace)
+        #logging.debug(f"Adding {subject} to RDF graph") 
+        _buffer[(subject, RDF.type, rdf_type, g)] = None
         
-        for attribute in fields(self): # iterate over all fields (attributes)
-            # skip private attributes
-            if attribute.name.startswith("_"):
-                continue
+        # dataclass fields are plain instance attributes: read them from the instance dict
+        # (RdfResource is not slotted, so every resource has one)
+        attribute_values = self.__dict__
+        for attribute_info, predicate, builder in plan: # iterate over the serializable attributes
             # process attribute
-            attribute_value = getattr(self, attribute.name, None) 
+            attribute_value = attribute_values.get(attribute_info.name)
             if attribute_value: # if the attribute is not None or en empty list
-                # determine the attribute namesspace
-                # by default, this is the same as the resource, but can be overridden by the attribute metadata
-                if 'namespace' in attribute.metadata:
-                    attribute_namespace = attribute.metadata["namespace"]
-                else:
-                    attribute_namespace = namespace
-                # the RDF predicate is based on the attribute name and namespace
-                predicate = attribute_namespace[attribute.name] # the RDF predicate is based on the attribute name
-                # collecte information on this attribute
-                attribute_info = self._get_attribute_info(attribute.name)
+                if predicate is None:
+                    # the RDF predicate is based on the attribute name and namespace (raises if undefined)
+                    predicate = attribute_info.metadata.get("namespace", namespace)[attribute_info.name]
                 # if not a list, convert to a single entry list so we can iterate
                 if not attribute_info.is_list:
                     attribute_value_items = [attribute_value]
                 else:
                     attribute_value_items = attribute_value
-                # this array will collect all the objects that need to be added
-                objects = [] 
-                # iterate over all values and add
-                for value in attribute_value_items:
-                    if issubclass(attribute_info.cls, RdfResource):
-                        object = value.add_to_rdf_graph(g)
-                        objects.append(object)
-                    elif issubclass(attribute_info.cls, str):
-                        objects.append(Literal(value, datatype=XSD.string))
-                    elif issubclass(attribute_info.cls, int):
-                        objects.append(Literal(value, datatype=XSD.integer))
-                    elif issubclass(attribute_info.cls, float):
-                        objects.append(Literal(value, datatype=XSD.float))
-                    elif issubclass(attribute_info.cls, bool):
-                        objects.append(Literal(value, datatype=XSD.boolean))
-                    elif issubclass(attribute_info.cls, datetime):
-                        objects.append(Literal(value.isoformat(), datatype=XSD.dateTime))
-                    elif issubclass(attribute_info.cls, date):
-                        objects.append(Literal(value.isoformat(), datatype=XSD.date))
-                    else:
-                        objects.append(Literal(value))
+                # build the objects that need to be added
+                objects = builder(attribute_value_items, g, _buffer, _emitted, _pending)
                 # add to this resource
                 if attribute_info.is_list:
                     if use_list:
                         # Create a list node with a URIRef based on the subject and attribute
                         # Do not use blank node.
-                        list_node = URIRef(f"{str(subject)}_{attribute.name}List")
-                        rdf_list = Collection(g, list_node, objects)  # noqa: F841
-                        g.add((subject, predicate, list_node)) # add the list_node, not rdf_list
+                        list_node = URIRef(f"{str(subject)}_{attribute_info.name}List")
+                        _emit_rdf_list(_buffer, g, list_node, objects)
+                        _buffer[(subject, predicate, list_node, g)] = None # add the list_node
                     else:
                         # add each entry as a triple
                         for object in objects:
-                            g.add((subject, predicate, object))
+                            _buffer[(subject, predicate, object, g)] = None
                 else:
                     # add single entry (there can only be one entry in this case)
-                    g.add((subject, predicate, objects[0]))
-        # return the URIRef                
-        return subject
+                    _buffer[(subject, predicate, objects[0], g)] = None
+
+    @classmethod
+    def add_many_to_rdf_graph(cls, resources, g:Graph, use_list=False) -> list[URIRef]:
+        """
+        Add several resources to an RDF graph.
+        
+        Equivalent to calling add_to_rdf_graph(...) on each resource, but the triples of all the
+        resources share one buffer and are added with a single g.addN(...).
+        Resources referenced more than once across the batch are only serialized once.
+        
+        Returns the list of the resources URIRefs, in order.
+        """
+        buffer = {}
+        emitted = set()
+        subjects = [resource.add_to_rdf_graph(g, use_list, buffer, emitted) for resource in resources]
+        g.addN(buffer)
+        return subjects
 
     def as_dict(self):
         """Returns the object as a dictionary"""
@@ -324,6 +455,16 @@ class RdfStringDirection(Enum):
         else:
             raise ValueError(f"Invalid direction: {direction_str}")
    
+# XSD datatypes of the RdfLiteralDeprecated values, looked up along the value class MRO
+_LITERAL_DATATYPES = {
+    str: XSD.string,
+    int: XSD.int,
+    float: XSD.float,
+    bool: XSD.boolean,
+    datetime: XSD.dateTime,
+    date: XSD.date,
+}
+
 @dataclass(kw_only=True)
 class RdfLiteralDeprecated(RdfResource):
     value: any
@@ -331,21 +472,11 @@ class RdfLiteralDeprecated(RdfResource):
     lang: Optional[str] = field(default=None)
     direction: Optional[RdfStringDirection] = field(default=None)
     
-    def add_to_rdf_graph(self, g:Graph, use_list=False) -> URIRef:
-        if isinstance(self.value, str):
-            return Literal(self.value, datatype=XSD.string)
-        elif isinstance(self.value, int):
-            return Literal(self.value, datatype=XSD.int)
-        elif isinstance(self.value, float):
-            return Literal(self.value, datatype=XSD.float)
-        elif isinstance(self.value, bool):
-            return Literal(self.value, datatype=XSD.boolean)
-        elif isinstance(self.value, datetime.datetime):
-            return Literal(self.value, datatype=XSD.dateTime)
-        elif isinstance(self.value, datetime.date):
-            return Literal(self.value, datatype=XSD.date)
-        else:
-            raise ValueError(f"Unexpected literal type {type(self.value)}")
+    def add_to_rdf_graph(self, g:Graph, use_list=False, _buffer:dict = None, _emitted:set = None) -> URIRef:
+        for value_type in type(self.value).__mro__:
+            if value_type in _LITERAL_DATATYPES:
+                return _make_literal(self.value, _LITERAL_DATATYPES[value_type])
+        raise ValueError(f"Unexpected literal type {type(self.value)}")
         
         
 @dataclass(kw_only=True)
@@ -356,19 +487,40 @@ class RdfString(RdfResource):
 
     @staticmethod
     def validate_lang(lang: str) -> bool:
-        if lang is not None and not re.match(r'^[a-zA-Z]{1,8}(-[a-zA-Z0-9]{1,8})*$', lang):
+        if lang is not None and not _LANG_RE.match(lang):
             return False
         else:
             return True
 
-    def add_to_rdf_graph(self, g:Graph, use_list=False) -> URIRef:
+    def add_to_rdf_graph(self, g:Graph, use_list=False, _buffer:dict = None, _emitted:set = None) -> URIRef:
         if self.value:
             if self.lang and not self.validate_lang(self.lang):
                 raise ValueError(f"Invalid language code {self.lang}")
         # NOTE: direction is currently not supported by Literal
-        return Literal(self.value, lang=self.lang, datatype=XSD.string)
+        return _make_literal(self.value, XSD.string, self.lang)
 
 
+@lru_cache(maxsize=4096)
+def _uri_validation_error(uri: str, valid_schemes: tuple) -> Optional[str]:
+    """Returns why the URI is not well-formed for the valid schemes, or None if it is valid.
+    
+    Cached, as the same URIs are often validated many times.
+    """
+    parsed = urlparse(uri)
+    # Check if the scheme is valid
+    if parsed.scheme not in valid_schemes:
+        return f"Invalid URI: {uri} -- invalid scheme {parsed.scheme}. Must be in {list(valid_schemes)}"
+    # Additional checks based on the scheme
+    if parsed.scheme in ['http', 'https', 'ftp']:
+        # For HTTP, HTTPS, and FTP, check if the netloc (domain) is present
+        if not parsed.netloc:
+            return f"Invalid URI: {uri} -- invalid network location {parsed.netloc}"
+    elif parsed.scheme == 'urn':
+        # For URNs, validate the format
+        if not _URN_RE.match(uri):
+            return f"Invalid URI: {uri} -- invalid pattern"
+    return None
+
 @dataclass(kw_only=True)
 class Uri(RdfProperty):
     value: str  # The URI value
@@ -380,20 +532,9 @@ class Uri(RdfProperty):
 
     def validate_uri(self,uri: str) -> bool:
         """Validate if the provided string is a well-formed URI."""
-        parsed = urlparse(uri)
-        # Check if the scheme is valid
-        if parsed.scheme not in self.valid_schemes:
-            raise ValueError(f"Invalid URI: {uri} -- invalid scheme {parsed.scheme}. Must be in {self.valid_schemes}") 
-        # Additional checks based on the scheme
-        if parsed.scheme in ['http', 'https', 'ftp']:
-            # For HTTP, HTTPS, and FTP, check if the netloc (domain) is present
-            if not parsed.netloc:
-                raise ValueError(f"Invalid URI: {uri} -- invalid network location {parsed.netloc}")
-        elif parsed.scheme == 'urn':
-            # For URNs, validate the format
-            urn_pattern = re.compile(r'^urn:[a-zA-Z0-9][a-zA-Z0-9-]{0,31}:[a-zA-Z0-9()+,\-.:=@;$_!*\'%/?#]+$')
-            if not urn_pattern.match(uri):
-                raise ValueError(f"Invalid URI: {uri} -- invalid pattern")
+        error = _uri_validation_error(uri, tuple(self.valid_schemes))
+        if error:
+            raise ValueError(error)
         # If all checks pass, the URI is valid
         return True
     
@@ -407,11 +548,7 @@ class Uri(RdfProperty):
     
     def is_valid_uri(self, uri: str, as_url=False, as_urn=False) -> bool:
         """Validate if the provided string is a well-formed URI."""
-        try:
-            self.validate_uri(uri)
-            return True
-        except ValueError:
-            return False
+        return _uri_validation_error(uri, tuple(self.valid_schemes)) is None
 
     def to_string(self) -> str:
         """Return the URI as a string."""
@@ -422,7 +559,7 @@ class Uri(RdfProperty):
         """Create an XsdAnyUri instance from a string."""
         return cls(value=uri_string)
     
-    def add_to_rdf_graph(self, g: Graph) -> URIRef:
+    def add_to_rdf_graph(self, g: Graph, use_list=False, _buffer:dict = None, _emitted:set = None) -> URIRef:
         """Override the add_to_rdf_graph method to simply return the URI as a URIRef.""" 
         return URIRef(self.value)
 
@@ -438,12 +575,22 @@ class Url(Uri):
 class UriOrString(Uri):
     """A hybrid property type that can be either a URI or a string."""
     lang: Optional[str] = field(default=None)
+    _rdf_node = None # (value, lang, node) cached by _get_rdf_node (not a dataclass field)
 
     def __post_init__(self):
-        pass # do not validate as URI
+        # do not validate as URI, but decide once if this is a URI or a string
+        self._get_rdf_node()
     
-    def add_to_rdf_graph(self, g: Graph):
-        if self.is_valid_uri(self.value):
-            return URIRef(value=self.value)
-        else:
-            return Literal(self.value, lang=self.lang) #RDF Literal
+    def _get_rdf_node(self):
+        """Returns the URIRef or Literal for the current value, recomputed only if value or lang changed."""
+        cached = self._rdf_node
+        if cached is None or cached[0] != self.value or cached[1] != self.lang:
+            if self.is_valid_uri(self.value):
+                node = URIRef(value=self.value)
+            else:
+                node = Literal(self.value, lang=self.lang) #RDF Literal
+            cached = self._rdf_node = (self.value, self.lang, node)
+        return cached[2]
+    
+    def add_to_rdf_graph(self, g: Graph, use_list=False, _buffer:dict = None, _emitted:set = None):
+        return self._get_rdf_node()
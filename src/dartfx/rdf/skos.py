@@ -7,8 +7,7 @@ from rdflib import SKOS
 @dataclass(kw_only=True)
 class SkosResource(rdf.RdfResource):
     def __post_init__(self):
-        if hasattr(super(), '__post_init__'):
-            super().__post_init__()
+        super().__post_init__()
         self._namespace = SKOS
 
 @dataclass(kw_only=True)
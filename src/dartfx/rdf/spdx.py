@@ -9,8 +9,7 @@ SPDX = "http://spdx.org/rdf/terms#"
 @dataclass(kw_only=True)
 class SpdxResource(rdf.RdfResource):
     def __post_init__(self):
-        if hasattr(super(), '__post_init__'):
-            super().__post_init__()
+        super().__post_init__()
         self._namespace = SPDX
 
 @dataclass(kw_only=True)
@@ -1,52 +1,35 @@
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 import uuid
 
-from rdflib import Graph
+from rdflib import RDF, Graph
 from .rdf import Uri
 
 def get_rdf_graph_statistics(g: Graph):
     stats = {}
     # count triples
-    query = """
-    SELECT (COUNT(*) AS ?n)
-    WHERE {
-        ?s ?p ?o
-    }
-    """
-    for row in g.query(query):
-        stats["n_triples"] = int(str(row.n))
+    stats["n_triples"] = len(g)
 
     # count type instances
-    query = """
-    SELECT ?type (COUNT(?instance) AS ?n)
-    WHERE {
-        ?instance a ?type .
-    }
-    GROUP BY ?type
-    ORDER BY ?type
-    """
+    type_counts = defaultdict(int)
+    subject_type_counts = defaultdict(int) # number of types of each typed resource
+    for instance, _, type in g.triples((None, RDF.type, None)):
+        type_counts[type] += 1
+        subject_type_counts[instance] += 1
     stats["types"] = {}
-    for row in g.query(query):
-        type = str(g.namespace_manager.qname(row.type))
-        stats["types"][type] = {}
-        stats["types"][type]["count"] = int(str(row.n))
+    for type in sorted(type_counts):
+        stats["types"][str(g.namespace_manager.qname(type))] = {"count": type_counts[type]}
 
     # count type properties instances
-    query = """
-    SELECT ?property (COUNT(?property) AS ?n)
-    WHERE {
-    ?resource a ?type .
-    ?resource ?property ?value .
-    }
-    GROUP BY ?property
-    ORDER BY ?property
-    """
+    # (a property of a resource is counted once per type of the resource)
+    property_counts = defaultdict(int)
+    for resource, property, _ in g:
+        if resource in subject_type_counts:
+            property_counts[property] += subject_type_counts[resource]
     stats["properties"] = {}
-    for row in g.query(query):
-        property = str(g.namespace_manager.qname(row.property))
-        stats["properties"][property] = {}
-        stats["properties"][property]["count"] = int(str(row.n))
+    for property in sorted(property_counts):
+        stats["properties"][str(g.namespace_manager.qname(property))] = {"count": property_counts[property]}
 
     return stats
 
@@ -7,8 +7,7 @@ XKOS = "src/dartfx/rdf/skos.py"
 @dataclass(kw_only=True)
 class XkosResource(rdf.RdfResource):
     def __post_init__(self):
-        if hasattr(super(), '__post_init__'):
-            super().__post_init__()
+        super().__post_init__()
         self._namespace = XKOS
 
 @dataclass(kw_only=True)
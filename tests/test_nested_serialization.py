@@ -1,6 +1,7 @@
-from typing import Annotated, Optional, List, ClassVar
-from rdflib import Namespace, URIRef, BNode, Graph
-import uuid
+from typing import Annotated, Optional
+import pytest
+from pydantic import ValidationError
+from rdflib import Namespace, URIRef, BNode
 from dartfx.rdf.pydantic import RdfBaseModel, RdfProperty
 
 EX = Namespace("http://example.org/")
@@ -39,12 +40,22 @@ def test_default_behavior():
     graph = person.to_rdf_graph()
     
     # Check that address has a UUID URI
-    person_uri = URIRef(str(EX) + "alice")
+    person_uri = person.rdf_subject
     addresses = list(graph.objects(person_uri, EX.address))
     assert len(addresses) == 1
     assert isinstance(addresses[0], URIRef)
     assert str(addresses[0]).startswith(str(EX)) or str(addresses[0]).startswith("urn:uuid:")
 
+def test_generated_subject_is_stable():
+    """Test that an id-less model keeps one generated subject, matching the written one."""
+    addr = Address(city="London")
+    graph = addr.to_rdf_graph()
+
+    assert addr.rdf_subject == addr.rdf_subject
+    assert list(graph.subjects(EX.city, None)) == [addr.rdf_subject]
+    assert Address.from_rdf_graph(graph, addr.rdf_subject).city == "London"
+    assert Address(city="London").rdf_subject != addr.rdf_subject
+
 def test_nested_behavior():
     """Test that disabling auto UUID produces BNodes (nested serialization)."""
     addr = NestedAddress(city="London", street="10 Downing St")
@@ -85,3 +96,8 @@ def test_top_level_bnode():
     subjects = list(graph.subjects(predicate=EX.city, object=None))
     assert len(subjects) == 1
     assert isinstance(subjects[0], BNode)
+
+def test_auto_uuid_keyword_is_rejected():
+    """Test that rdf_auto_uuid cannot be passed per instance, as it would be ignored."""
+    with pytest.raises(ValidationError, match="rdf_auto_uuid is a class setting"):
+        Address(city="Paris", rdf_auto_uuid=False)
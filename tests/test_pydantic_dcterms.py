@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from dartfx.rdf.pydantic.dcterms import DcmiFrequency, DublinCoreRecord
+
+
+def test_dublin_core_record_json_round_trip():
+    pytest.importorskip("orjson")
+    record = DublinCoreRecord(
+        id="record-1",
+        title="Example",
+        created=datetime(2024, 5, 1, 12, 30),
+        accrual_periodicity=DcmiFrequency.MONTHLY,
+    )
+
+    data = record.to_json()
+
+    assert DublinCoreRecord.from_json(data) == record
+    trusted = DublinCoreRecord.from_json(data, validate=False)
+    assert trusted.title == "Example"
+    assert trusted.created == "2024-05-01T12:30:00"
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from dartfx.rdf.pydantic.skos import _SCHEME_BLOOMS, Concept, ConceptScheme, ConceptTable
+
+
+def test_concept_table_round_trip():
+    scheme = ConceptScheme(id="scheme", pref_label=["Scheme"])
+    concepts = [
+        Concept(id=f"c{i}", pref_label=[f"Label {i}"], in_scheme=[scheme], broader=["https://example.org/top"])
+        for i in range(3)
+    ]
+    expected = Graph()
+    for concept in concepts:
+        concept.to_rdf_graph(expected)
+
+    table = ConceptTable.from_concepts(concepts)
+
+    assert len(table) == 3
+    assert table["pref_label"] == [["Label 0"], ["Label 1"], ["Label 2"]]
+    assert isomorphic(table.to_rdf_graph(), expected)
+    assert [c.model_dump() for c in table.to_concepts()] == [c.model_dump() for c in concepts]
+
+
+def test_concept_scheme_might_contain():
+    leaf = Concept(id="leaf")
+    scheme = ConceptScheme(
+        id="scheme",
+        has_top_concept=[Concept(id="top", narrower=[leaf]), "https://example.org/other"],
+    )
+
+    assert scheme.might_contain(leaf._subject_uri())
+    assert scheme.might_contain("https://example.org/other")
+    assert not scheme.might_contain("https://example.org/missing")
+    assert scheme == scheme.model_copy()
+
+    scheme.has_top_concept = ["https://example.org/missing"]
+    assert scheme.might_contain("https://example.org/missing")
+
+    empty = ConceptScheme(id="empty")
+    assert not empty.might_contain("https://example.org/other")
+    bloom = _SCHEME_BLOOMS[id(empty)][1]
+    assert not empty.might_contain("https://example.org/missing")
+    assert _SCHEME_BLOOMS[id(empty)][1] is bloom
+
+
+def test_concept_scheme_might_contain_sees_in_place_edits():
+    top = Concept(id="top", narrower=[])
+    scheme = ConceptScheme(id="scheme", has_top_concept=[top])
+    assert not scheme.might_contain(Concept(id="added")._subject_uri())
+
+    top.narrower.append(Concept(id="added"))
+    assert scheme.might_contain(Concept(id="added")._subject_uri())
+
+    scheme.has_top_concept[0] = "https://example.org/swapped"
+    assert scheme.might_contain("https://example.org/swapped")
+    assert not scheme.might_contain(top._subject_uri())
+
+
+def test_concept_iter_transitive():
+    root = Concept(id="root", broader=["https://example.org/top"])
+    middle = Concept(id="middle", broader=[root])
+    leaf = Concept(id="leaf", broader=[middle, root])
+    root.broader.append(leaf)
+
+    assert [getattr(c, "id", c) for c in leaf.iter_transitive()] == ["middle", "root", "https://example.org/top"]
+
+
+def test_parsed_references_share_one_string():
+    graph = Graph()
+    for i in range(3):
+        Concept(id=f"c{i}", broader=["https://example.org/parent"]).to_rdf_graph(graph)
+
+    concepts = Concept.from_rdf_graph_many(graph)
+
+    assert concepts[0].broader[0] is concepts[1].broader[0] is concepts[2].broader[0]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from dartfx.rdf.pydantic.spdx import Annotation, CreationInfo, Package, Review
+
+
+def test_spdx_fast_construct_matches_validated_model():
+    values = {"name": ["example"], "homepage": ["https://example.org/"]}
+
+    fast = Package.fast_construct(**values, unknown=["ignored"])
+
+    assert fast == Package(**values)
+    assert fast.model_fields_set == {"name", "homepage"}
+    assert fast.rdf_type == str(Package.model_fields["rdf_type"].default)
+    assert fast.to_rdf("nt").count("\n") == Package(**values).to_rdf("nt").count("\n")
+
+
+def test_spdx_timestamps_are_parsed_to_datetime():
+    info = CreationInfo(created=["2010-01-29T18:30:22Z", "2010-01-29T18:30:22Z"])
+
+    assert info.created[0] == datetime(2010, 1, 29, 18, 30, 22, tzinfo=timezone.utc)
+    assert info.created[0] is info.created[1]
+    for value in ("yesterday", "2020", 2020):
+        with pytest.raises(ValidationError):
+            CreationInfo(created=[value])
+    with pytest.raises(ValidationError):
+        Review(review_date=["1262304000"])
+    with pytest.raises(ValidationError):
+        Annotation(annotation_date=["not a date"])
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from rdflib import RDF, URIRef
+
+from dartfx.rdf.pydantic.vcard import VCARD, EmailType, Friend, Group, Individual, Organization, Related, TelephoneType
+
+
+def test_related_kinds():
+    friend = Friend(has_value=["https://example.org/bob"])
+
+    assert isinstance(friend, Related)
+    assert friend.rdf_type == str(VCARD.Friend)
+    assert Related.of_kind("Colleague").rdf_type == str(VCARD.Colleague)
+    graph = friend.to_rdf_graph()
+    assert (None, RDF.type, URIRef(VCARD.Friend)) in graph
+    with pytest.raises(ValueError):
+        Related.of_kind("Nemesis")
+
+
+def test_related_kind_round_trip():
+    friend = Friend(has_value=["https://example.org/bob"])
+    ttl = friend.to_rdf(format="turtle")
+
+    restored = Friend.from_rdf(ttl)
+    generic = Related.from_rdf(ttl)
+
+    assert isinstance(restored, Friend)
+    assert restored.rdf_type == str(VCARD.Friend)
+    assert isinstance(generic, Friend)
+    assert generic.model_dump() == friend.model_dump()
+    assert isinstance(Related.of_kind("Friend"), Friend)
+
+
+def test_vcard_type_enumerations():
+    assert TelephoneType.CELL.uri == VCARD.Cell
+    assert TelephoneType.TEXT_PHONE.uri == VCARD.TextPhone
+    assert TelephoneType.from_uri(str(VCARD.Fax)) is TelephoneType.FAX
+    assert EmailType.from_uri(VCARD.Internet) is EmailType.INTERNET
+    with pytest.raises(ValueError):
+        EmailType.from_uri(VCARD.Cell)
+
+
+def test_group_members_dispatch_on_rdf_type():
+    group = Group(
+        has_member=[
+            URIRef("https://example.org/alice"),
+            Individual(fn=["Bob"]),
+            {"rdf_type": str(VCARD.Organization), "fn": ["ACME"]},
+        ]
+    )
+
+    assert isinstance(group.has_member[0], URIRef)
+    assert isinstance(group.has_member[1], Individual)
+    assert isinstance(group.has_member[2], Organization)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from rdflib import RDF, SKOS, XSD, Graph, Literal, Namespace, URIRef
+from rdflib.collection import Collection
+from rdflib.compare import isomorphic
+
+from dartfx.rdf import rdf, skos
+
+EX = Namespace("https://example.org/")
+
+
+@dataclass(kw_only=True)
+class Thing(rdf.RdfResource):
+    flag: Optional[bool] = None
+    issued: Optional[date] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._namespace = EX
+
+
+def _scheme() -> skos.ConceptScheme:
+    scheme = skos.ConceptScheme()
+    scheme.set_uri(EX.scheme)
+    scheme.add_pref_label("Scheme")
+    for i in range(3):
+        concept = skos.Concept()
+        concept.set_uri(EX[f"c{i}"])
+        concept.add_pref_label(f"Concept {i}")
+        scheme.add_has_top_concept(concept)
+    return scheme
+
+
+def test_skos_scheme():
+    g = Graph()
+    subject = _scheme().add_to_rdf_graph(g)
+
+    assert subject == EX.scheme
+    assert (EX.scheme, RDF.type, SKOS.ConceptScheme) in g
+    assert (EX.scheme, SKOS.prefLabel, Literal("Scheme", datatype=XSD.string)) in g
+    assert set(g.objects(EX.scheme, SKOS.hasTopConcept)) == {EX.c0, EX.c1, EX.c2}
+    for i in range(3):
+        assert (EX[f"c{i}"], RDF.type, SKOS.Concept) in g
+        assert (EX[f"c{i}"], SKOS.prefLabel, Literal(f"Concept {i}", datatype=XSD.string)) in g
+    assert not list(g.triples((None, RDF.first, None)))
+
+
+def test_skos_scheme_use_list():
+    g = Graph()
+    _scheme().add_to_rdf_graph(g, use_list=True)
+
+    list_node = URIRef(f"{EX.scheme}_hasTopConceptList")
+    assert (EX.scheme, SKOS.hasTopConcept, list_node) in g
+    assert list(Collection(g, list_node)) == [EX.c0, EX.c1, EX.c2]
+    assert (list_node, RDF.rest, URIRef(f"{list_node}_1")) in g
+    # nested resources are serialized without RDF lists
+    assert (EX.c0, SKOS.prefLabel, Literal("Concept 0", datatype=XSD.string)) in g
+
+
+def test_literal_datatypes():
+    thing = Thing(flag=True, issued=date(2024, 1, 2))
+    thing.set_uri(EX.thing)
+    g = Graph()
+    thing.add_to_rdf_graph(g)
+
+    assert (EX.thing, EX.flag, Literal(True, datatype=XSD.boolean)) in g
+    assert (EX.thing, EX.issued, Literal("2024-01-02", datatype=XSD.date)) in g
+    assert rdf.RdfLiteralDeprecated(value=False).add_to_rdf_graph(g) == Literal(False, datatype=XSD.boolean)
+
+
+def test_deep_broader_chain():
+    depth = sys.getrecursionlimit() + 100
+    concepts = []
+    for i in range(depth):
+        concept = skos.Concept()
+        concept.set_uri(EX[f"level{i}"])
+        if concepts:
+            concept.add_broader(concepts[-1])
+        concepts.append(concept)
+
+    g = Graph()
+    concepts[-1].add_to_rdf_graph(g)
+
+    assert len(set(g.subjects(RDF.type, SKOS.Concept))) == depth
+    assert len(list(g.triples((None, SKOS.broader, None)))) == depth - 1
+    assert (EX[f"level{depth - 1}"], SKOS.broader, EX[f"level{depth - 2}"]) in g
+
+
+def test_add_many_to_rdf_graph():
+    scheme = _scheme()
+    resources = [scheme, *scheme.hasTopConcept]
+    expected = Graph()
+    for resource in resources:
+        resource.add_to_rdf_graph(expected)
+
+    g = Graph()
+    subjects = rdf.RdfResource.add_many_to_rdf_graph(resources, g)
+
+    assert subjects == [EX.scheme, EX.c0, EX.c1, EX.c2]
+    assert isomorphic(g, expected)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+from dartfx.rdf.pydantic.spdx import Checksum, CreationInfo, Package, SpdxDocument
+from dartfx.rdf.pydantic.spdx_msgspec import (
+    PackageMsg,
+    dump_spdx_json,
+    from_pydantic,
+    load_spdx_json,
+)
+
+
+def test_spdx_msgspec_json_round_trip(tmp_path):
+    document = SpdxDocument(
+        spdx_version=["SPDX-2.3"],
+        name=["example-sbom"],
+        creation_info=[CreationInfo(created=["2024-05-01T12:00:00Z"], creator=["Tool: example"])],
+        describes_package=[
+            Package(
+                name=["example"],
+                version_info=["1.0.0"],
+                checksum=[Checksum(algorithm=["SHA1"], checksum_value=["abc123"])],
+            ),
+            "https://example.org/spdx/other-package",
+        ],
+    )
+    path = tmp_path / "sbom.json"
+    dump_spdx_json(document, path)
+
+    loaded = load_spdx_json(path)
+
+    assert isinstance(loaded, SpdxDocument)
+    assert loaded.name == ["example-sbom"]
+    package = loaded.describes_package[0]
+    assert isinstance(package, Package)
+    assert package.version_info == ["1.0.0"]
+    assert isinstance(package.checksum[0], Checksum)
+    assert package.checksum[0].checksum_value == ["abc123"]
+    assert loaded.creation_info[0].created == document.creation_info[0].created
+    assert loaded.describes_package[1] == "https://example.org/spdx/other-package"
+    assert isinstance(from_pydantic(package), PackageMsg)
+
+
+def test_spdx_msgspec_reads_pydantic_json(tmp_path):
+    document = SpdxDocument(name=["from-pydantic"], describes_package=[Package(name=["pkg"])])
+    path = tmp_path / "sbom.json"
+    path.write_text(document.model_dump_json(exclude_none=True))
+
+    loaded = load_spdx_json(path)
+
+    assert loaded.name == ["from-pydantic"]
+    assert loaded.describes_package[0].name == ["pkg"]
+    assert "<http://spdx.org/rdf/terms#Package>" in loaded.to_rdf("nt")
+